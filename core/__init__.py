@@ -1,7 +1,7 @@
 """Core модули приложения."""
 
-from .config import Config
+from .config import Config, SortType
 from .database import Database
 from .telegram_client import TelegramClientWrapper
 
-__all__ = ['Config', 'Database', 'TelegramClientWrapper']
+__all__ = ['Config', 'SortType', 'Database', 'TelegramClientWrapper']
@@ -23,10 +23,36 @@
 
 import json
 import os
+from enum import IntEnum
 from pathlib import Path
 from typing import List, Optional
 
 
+class SortType(IntEnum):
+    """
+    Вид сортировки списка каналов.
+    
+    В config.json хранится строковый ключ — имя константы в нижнем регистре.
+    """
+    NONE = 0
+    TYPE = 1
+    ID = 2
+    NAME = 3
+    SELECTED = 4
+    TYPE_ID = 5
+    TYPE_NAME = 6
+    TYPE_SELECTED = 7
+
+    @property
+    def key(self) -> str:
+        """Строковое значение для config.json."""
+        return self.name.lower()
+
+
+# Строковый ключ из config.json -> SortType
+_SORT_TYPES_BY_KEY = {sort_type.key: sort_type for sort_type in SortType}
+
+
 class Config:
     """Класс для работы с конфигурацией приложения."""
     
@@ -56,10 +82,19 @@ class Config:
             config_path = data_dir / "config.json"
         
         self.config_path = Path(config_path)
+        self._config_mtime: Optional[float] = None
         self._config = self._load_config()
     
+    def _stat_mtime(self) -> Optional[float]:
+        """Возвращает время изменения файла конфигурации или None, если файла нет."""
+        try:
+            return self.config_path.stat().st_mtime
+        except OSError:
+            return None
+    
     def _load_config(self) -> dict:
         """Загружает конфигурацию из файла."""
+        self._config_mtime = self._stat_mtime()
         if self.config_path.exists():
             try:
                 with open(self.config_path, 'r', encoding='utf-8') as f:
@@ -76,6 +111,7 @@ class Config:
         try:
             with open(self.config_path, 'w', encoding='utf-8') as f:
                 json.dump(self._config, f, indent=2, ensure_ascii=False)
+            self._config_mtime = self._stat_mtime()
             return True
         except IOError as e:
             print(f"Ошибка сохранения конфигурации: {e}")
@@ -145,37 +181,31 @@ class Config:
         self._config["webhook_default_channel"] = channel_id
         self._save_config()
     
-    def get_channels_sort_type(self) -> str:
+    def get_channels_sort_type(self) -> SortType:
         """
         Возвращает текущий вид сортировки каналов.
         
         Returns:
-            Вид сортировки:
-            - "none", "type", "id", "name", "selected"
-            - "type_id", "type_name", "type_selected"
+            Вид сортировки. Неизвестное значение в конфиге — SortType.NONE
         """
-        return self._config.get("channels_sort_type", "none")
+        return _SORT_TYPES_BY_KEY.get(
+            self._config.get("channels_sort_type", "none"), SortType.NONE
+        )
     
-    def set_channels_sort_type(self, sort_type: str) -> None:
+    def set_channels_sort_type(self, sort_type: SortType) -> None:
         """
         Устанавливает вид сортировки каналов.
         
         Args:
             sort_type: Вид сортировки.
         """
-        valid_types = [
-            "none",
-            "type",
-            "id",
-            "name",
-            "selected",
-            "type_id",
-            "type_name",
-            "type_selected",
-        ]
-        if sort_type not in valid_types:
-            raise ValueError(f"Неверный тип сортировки. Допустимые: {valid_types}")
-        self._config["channels_sort_type"] = sort_type
+        try:
+            sort_type = SortType(sort_type)
+        except ValueError:
+            raise ValueError(
+                f"Неверный тип сортировки. Допустимые: {[t.key for t in SortType]}"
+            ) from None
+        self._config["channels_sort_type"] = sort_type.key
         self._save_config()
 
     def get_messages_sort_order(self) -> str:
@@ -254,6 +284,21 @@ class Config:
         """Перезагружает конфигурацию из файла."""
         self._config = self._load_config()
     
+    def reload_if_changed(self) -> bool:
+        """
+        Перечитывает конфигурацию, только если файл изменён извне.
+        
+        Геттеры работают с копией в памяти; метод позволяет долгоживущим
+        объектам подхватывать внешние правки ценой одного stat().
+        
+        Returns:
+            True если конфигурация была перечитана
+        """
+        if self._stat_mtime() == self._config_mtime:
+            return False
+        self.reload()
+        return True
+    
     def to_dict(self) -> dict:
         """Возвращает конфигурацию как словарь."""
         return self._config.copy()
@@ -17,6 +17,9 @@ from typing import List, Optional, Dict, Any, Tuple
 class Database:
     """Класс для работы с SQLite базой данных."""
     
+    # Максимум параметров в одном IN (...) — с запасом до лимита SQLite (999 в старых сборках)
+    _IN_CHUNK_SIZE = 500
+    
     def __init__(self, db_path: str = None):
         """
         Инициализация базы данных.
@@ -39,6 +42,10 @@ class Database:
         """Создаёт соединение с базой данных."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # Настройки уровня соединения: в режиме WAL fsync выполняется при checkpoint,
+        # а не при каждом COMMIT
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
         return conn
     
     def _init_database(self) -> None:
@@ -46,6 +53,9 @@ class Database:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
+            # WAL сохраняется в файле БД — достаточно включить один раз
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Таблица отправителей
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS senders (
@@ -147,6 +157,79 @@ class Database:
             conn.commit()
             return cursor.lastrowid
     
+    def get_or_create_senders_bulk(self, senders: List[Dict[str, Any]]) -> Dict[int, int]:
+        """
+        Получает или создаёт пачку отправителей в одной транзакции.
+        
+        Args:
+            senders: Словари с полями id (Telegram ID), first_name, last_name, username
+            
+        Returns:
+            Словарь telegram_id -> ID отправителя в базе данных
+        """
+        if not senders:
+            return {}
+        # Повторы одного отправителя сливаются по полям так же, как при
+        # последовательных вызовах get_or_create_sender (COALESCE): непустое
+        # значение из более позднего вхождения заменяет прежнее, None его не затирает
+        by_telegram_id: Dict[int, Dict[str, Any]] = {}
+        for sender in senders:
+            merged = by_telegram_id.get(sender['id'])
+            if merged is None:
+                by_telegram_id[sender['id']] = {
+                    field: sender.get(field) for field in ('first_name', 'last_name', 'username')
+                }
+                continue
+            for field in ('first_name', 'last_name', 'username'):
+                value = sender.get(field)
+                if value is not None:
+                    merged[field] = value
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            result = self._select_sender_ids(cursor, list(by_telegram_id))
+            
+            # Обновляем существующих
+            cursor.executemany("""
+                UPDATE senders 
+                SET first_name = COALESCE(?, first_name),
+                    last_name = COALESCE(?, last_name),
+                    username = COALESCE(?, username)
+                WHERE telegram_id = ?
+            """, [
+                (s.get('first_name'), s.get('last_name'), s.get('username'), tid)
+                for tid, s in by_telegram_id.items() if tid in result
+            ])
+            
+            # Создаём новых
+            new_ids = [tid for tid in by_telegram_id if tid not in result]
+            if new_ids:
+                cursor.executemany("""
+                    INSERT INTO senders (telegram_id, first_name, last_name, username)
+                    VALUES (?, ?, ?, ?)
+                """, [
+                    (tid, by_telegram_id[tid].get('first_name'),
+                     by_telegram_id[tid].get('last_name'), by_telegram_id[tid].get('username'))
+                    for tid in new_ids
+                ])
+                result.update(self._select_sender_ids(cursor, new_ids))
+            conn.commit()
+            return result
+    
+    def _select_sender_ids(self, cursor: sqlite3.Cursor,
+                           telegram_ids: List[int]) -> Dict[int, int]:
+        """Возвращает telegram_id -> ID для уже существующих отправителей."""
+        result: Dict[int, int] = {}
+        for i in range(0, len(telegram_ids), self._IN_CHUNK_SIZE):
+            chunk = telegram_ids[i:i + self._IN_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f"SELECT id, telegram_id FROM senders WHERE telegram_id IN ({placeholders})",
+                chunk
+            )
+            for row in cursor.fetchall():
+                result[row['telegram_id']] = row['id']
+        return result
+    
     def get_senders_list(self) -> List[Dict[str, Any]]:
         """Возвращает список всех отправителей."""
         with self._get_connection() as conn:
@@ -211,6 +294,62 @@ class Database:
             """, (telegram_id, channel_id))
             return cursor.fetchone()['id']
     
+    def save_messages_bulk(self, messages: List[Dict[str, Any]]) -> List[int]:
+        """
+        Сохраняет или обновляет пачку сообщений в одной транзакции.
+        
+        Args:
+            messages: Словари с полями как у save_message (telegram_id, channel_id,
+                     content, date, sender_id, reply_to_msg_id, reactions_count, raw_json)
+            
+        Returns:
+            ID сообщений в базе данных в порядке входного списка
+        """
+        if not messages:
+            return []
+        rows = [
+            (m['telegram_id'], m['channel_id'], m.get('content'), m.get('date'),
+             m.get('sender_id'), m.get('reply_to_msg_id'),
+             m.get('reactions_count', 0), m.get('raw_json'))
+            for m in messages
+        ]
+        by_channel: Dict[int, set] = {}
+        for m in messages:
+            by_channel.setdefault(m['channel_id'], set()).add(m['telegram_id'])
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO messages 
+                    (telegram_id, channel_id, content, date, sender_id, 
+                     reply_to_msg_id, reactions_count, raw_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(telegram_id, channel_id) DO UPDATE SET
+                    content = excluded.content,
+                    date = excluded.date,
+                    sender_id = excluded.sender_id,
+                    reply_to_msg_id = excluded.reply_to_msg_id,
+                    reactions_count = excluded.reactions_count,
+                    raw_json = excluded.raw_json,
+                    fetched_at = CURRENT_TIMESTAMP
+            """, rows)
+            
+            # Получаем ID сообщений
+            ids: Dict[Tuple[int, int], int] = {}
+            for channel_id, telegram_ids in by_channel.items():
+                telegram_ids = list(telegram_ids)
+                for i in range(0, len(telegram_ids), self._IN_CHUNK_SIZE):
+                    chunk = telegram_ids[i:i + self._IN_CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(f"""
+                        SELECT id, telegram_id FROM messages 
+                        WHERE channel_id = ? AND telegram_id IN ({placeholders})
+                    """, [channel_id, *chunk])
+                    for row in cursor.fetchall():
+                        ids[(row['telegram_id'], channel_id)] = row['id']
+            conn.commit()
+            return [ids[(m['telegram_id'], m['channel_id'])] for m in messages]
+    
     def get_message(self, message_id: int) -> Optional[Dict[str, Any]]:
         """Получает сообщение по ID."""
         with self._get_connection() as conn:
@@ -411,6 +550,23 @@ class Database:
             conn.commit()
             return cursor.lastrowid
     
+    def save_reactions_snapshots_bulk(self, snapshots: List[Tuple[int, int]]) -> None:
+        """
+        Сохраняет снимки реакций для пачки сообщений в одной транзакции.
+        
+        Args:
+            snapshots: Пары (message_id, reactions_count)
+        """
+        if not snapshots:
+            return
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO reactions_history (message_id, reactions_count)
+                VALUES (?, ?)
+            """, snapshots)
+            conn.commit()
+    
     def get_messages_with_reaction_changes(self, 
                                            hours: int = 24) -> List[Dict[str, Any]]:
         """
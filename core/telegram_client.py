@@ -10,7 +10,7 @@
 
 import asyncio
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List, Optional, Dict, Any, AsyncIterator
 
@@ -23,6 +23,13 @@ from telethon.tl.types import (
 from telethon.errors import SessionPasswordNeededError
 
 
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Приводит datetime с часовым поясом к наивному UTC; наивные значения не меняет."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 class TelegramClientWrapper:
     """Обёртка над TelegramClient для упрощения работы."""
     
@@ -179,29 +186,51 @@ class TelegramClientWrapper:
             Список диалогов
         """
         dialogs = await self.client.get_dialogs(limit=limit, archived=False)
-        result = []
-        
-        for dialog in dialogs:
-            entity = dialog.entity
-            dialog_info = {
-                'id': dialog.id,
-                'name': dialog.name,
-                'unread_count': dialog.unread_count,
-                'is_channel': isinstance(entity, Channel) and entity.broadcast,
-                'is_group': isinstance(entity, (Chat, Channel)) and (
-                    isinstance(entity, Chat) or 
-                    (isinstance(entity, Channel) and entity.megagroup)
-                ),
-                'is_user': isinstance(entity, User)
-            }
-            
-            if isinstance(entity, Channel):
-                dialog_info['username'] = entity.username
-                dialog_info['participants_count'] = getattr(entity, 'participants_count', None)
-            
-            result.append(dialog_info)
+        return [self._dialog_to_dict(dialog) for dialog in dialogs]
+    
+    async def get_dialogs_count(self) -> int:
+        """
+        Возвращает общее количество неархивированных диалогов.
+        
+        Запрос с limit=0 не загружает сами диалоги — только счётчик.
+        """
+        dialogs = await self.client.get_dialogs(limit=0, archived=False)
+        return dialogs.total
+    
+    async def iter_dialogs(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Итерирует неархивированные диалоги по мере их загрузки.
+        
+        В отличие от get_dialogs не ждёт загрузки всего списка: первые
+        диалоги доступны после первого запроса к API.
+        
+        Yields:
+            Словарь с информацией о диалоге
+        """
+        async for dialog in self.client.iter_dialogs(archived=False):
+            yield self._dialog_to_dict(dialog)
+    
+    @staticmethod
+    def _dialog_to_dict(dialog) -> Dict[str, Any]:
+        """Конвертирует объект Dialog в словарь."""
+        entity = dialog.entity
+        dialog_info = {
+            'id': dialog.id,
+            'name': dialog.name,
+            'unread_count': dialog.unread_count,
+            'is_channel': isinstance(entity, Channel) and entity.broadcast,
+            'is_group': isinstance(entity, (Chat, Channel)) and (
+                isinstance(entity, Chat) or 
+                (isinstance(entity, Channel) and entity.megagroup)
+            ),
+            'is_user': isinstance(entity, User)
+        }
+        
+        if isinstance(entity, Channel):
+            dialog_info['username'] = entity.username
+            dialog_info['participants_count'] = getattr(entity, 'participants_count', None)
         
-        return result
+        return dialog_info
     
     async def get_dialog_info(self, dialog_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -303,6 +332,9 @@ class TelegramClientWrapper:
         Returns:
             Список сообщений
         """
+        # Даты сообщений сравниваются как наивные UTC — приводим границы один раз
+        date_from = _to_naive_utc(date_from)
+        date_to = _to_naive_utc(date_to)
         try:
             entity = await self.client.get_entity(channel_id)
         except Exception as e:
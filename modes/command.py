@@ -13,6 +13,7 @@ import contextlib
 import io
 import json
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 
@@ -27,6 +28,14 @@ from utils.message_sorting import group_and_sort_messages
 from utils.timezone import get_timezone
 
 
+# Готовый вывод для пустого списка сообщений (json-reactions читает БД — не кэшируем).
+_EMPTY_OUTPUT: Dict[str, str] = {
+    'text': format_messages([]),
+    'json': json.dumps({'standalone_messages': [], 'chains': []}, ensure_ascii=False, indent=2),
+    'json-no-chains': json.dumps({'messages': []}, ensure_ascii=False, indent=2),
+}
+
+
 async def run_command_mode(api_id: int, api_hash: str, args):
     """
     Запускает командный режим.
@@ -120,50 +129,41 @@ class CommandHandler:
             if getattr(self.args, "limit", None) is not None
             else self.config.get_fetch_messages_limit()
         )
-        for channel_id in channel_ids:
-            messages = await self.telegram.fetch_messages_by_date(
-                channel_id,
-                date_from,
-                date_to,
-                limit=limit,
-                pause_seconds=self.config.get_fetch_messages_pause_seconds(),
-            )
-            
-            # Сохраняем в базу
-            for msg in messages:
-                sender_id = None
-                if msg['sender']:
-                    sender_id = self.database.get_or_create_sender(
-                        msg['sender']['id'],
-                        msg['sender']['first_name'],
-                        msg['sender']['last_name'],
-                        msg['sender']['username']
+        # Запись в SQLite уходит в отдельный поток и идёт параллельно с загрузкой
+        # следующего канала. Один воркер сохраняет порядок записей и единственного писателя.
+        loop = asyncio.get_running_loop()
+        pending_writes: List[asyncio.Future] = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                for channel_id in channel_ids:
+                    messages = await self.telegram.fetch_messages_by_date(
+                        channel_id,
+                        date_from,
+                        date_to,
+                        limit=limit,
+                        pause_seconds=self.config.get_fetch_messages_pause_seconds(),
                     )
-                
-                db_msg_id = self.database.save_message(
-                    telegram_id=msg['telegram_id'],
-                    channel_id=msg['channel_id'],
-                    content=msg['content'],
-                    date=msg['date'],
-                    sender_id=sender_id,
-                    reply_to_msg_id=msg['reply_to_msg_id'],
-                    reactions_count=msg['reactions_count'],
-                    raw_json=msg['raw_json']
-                )
-                saved_message_ids.append(db_msg_id)
-                
-                # Сохраняем реакции если нужно
-                if self.args.track_reactions:
-                    self.database.save_reactions_snapshot(
-                        db_msg_id, msg['reactions_count']
+                    pending_writes.append(
+                        loop.run_in_executor(executor, self._save_messages, messages)
                     )
-            
-            all_messages.extend(messages)
-            
-            info = await self.telegram.get_dialog_info(channel_id)
-            name = info.get('title', 'Неизвестно') if info else 'Неизвестно'
-            channel_titles[int(channel_id)] = name
-            print(f"  {name}: {len(messages)} сообщений")
+                    all_messages.extend(messages)
+
+                    info = await self.telegram.get_dialog_info(channel_id)
+                    name = info.get('title', 'Неизвестно') if info else 'Неизвестно'
+                    channel_titles[int(channel_id)] = name
+                    print(f"  {name}: {len(messages)} сообщений")
+            finally:
+                # Дожидаемся записей и при ошибке загрузки: иначе выход из with
+                # заблокирует цикл событий в shutdown(wait=True), а ошибки записи потеряются
+                write_results = await asyncio.gather(*pending_writes, return_exceptions=True)
+                write_errors = [r for r in write_results if isinstance(r, BaseException)]
+                for error in write_errors:
+                    print(f"Ошибка сохранения сообщений в БД: {error}")
+
+        if write_errors:
+            raise write_errors[0]
+        for ids in write_results:
+            saved_message_ids.extend(ids)
         
         print(f"\nВсего: {len(all_messages)} сообщений")
 
@@ -203,6 +203,42 @@ class CommandHandler:
                 print(f"Удалено из БД: {count} сообщений")
             return None
     
+    def _save_messages(self, messages: List[Dict[str, Any]]) -> List[int]:
+        """
+        Сохраняет сообщения канала в БД (вместе с отправителями и снимками реакций).
+
+        Выполняется синхронно — вызывается из потока-писателя в handle_fetch.
+
+        Returns:
+            ID сохранённых сообщений в порядке входного списка
+        """
+        # Отправители и сообщения пишутся пачками: по транзакции на таблицу
+        # Повторы отправителя сливает get_or_create_senders_bulk
+        senders = [msg['sender'] for msg in messages if msg['sender']]
+        sender_ids = self.database.get_or_create_senders_bulk(senders)
+        
+        saved_ids = self.database.save_messages_bulk([
+            {
+                'telegram_id': msg['telegram_id'],
+                'channel_id': msg['channel_id'],
+                'content': msg['content'],
+                'date': msg['date'],
+                'sender_id': sender_ids.get(msg['sender']['id']) if msg['sender'] else None,
+                'reply_to_msg_id': msg['reply_to_msg_id'],
+                'reactions_count': msg['reactions_count'],
+                'raw_json': msg['raw_json'],
+            }
+            for msg in messages
+        ])
+        
+        # Сохраняем реакции если нужно
+        if self.args.track_reactions:
+            self.database.save_reactions_snapshots_bulk([
+                (db_msg_id, msg['reactions_count'])
+                for db_msg_id, msg in zip(saved_ids, messages)
+            ])
+        return saved_ids
+    
     async def handle_clear(self):
         """Обрабатывает команду очистки."""
         channel_id = self.args.clear_channel
@@ -397,6 +433,8 @@ class CommandHandler:
     ) -> str:
         """Форматирует вывод в зависимости от --output."""
         output_format = self.args.output
+        if not messages and output_format in _EMPTY_OUTPUT:
+            return _EMPTY_OUTPUT[output_format]
         sort_order = self._get_messages_sort_order()
         channel_titles = channel_titles or {}
         grouped = group_and_sort_messages(messages, sort_order=sort_order)
@@ -10,44 +10,163 @@
 
 import asyncio
 import os
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Optional, Callable, List, Dict, Any, FrozenSet, Tuple
 
 from core.telegram_client import TelegramClientWrapper
 from core.database import Database
-from core.config import Config
+from core.config import Config, SortType
+
+
+# Очистка экрана ANSI-последовательностью вместо запуска внешней команды.
+# На Windows (консоль без гарантированной поддержки ANSI) и без TTY — через cls/clear.
+_ANSI_CLEAR = sys.stdout.isatty() and os.name != 'nt'
 
 
 def clear_screen():
     """Очищает экран консоли."""
-    import os
+    if _ANSI_CLEAR:
+        sys.stdout.write("\x1b[H\x1b[2J")
+        sys.stdout.flush()
+        return
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
+def header_lines(title: str) -> List[str]:
+    """Возвращает строки заголовка меню."""
+    return ["", "=" * 50, f"  {title}", "=" * 50]
+
+
+def menu_lines(options: list) -> List[str]:
+    """Возвращает строки пунктов меню."""
+    lines = [""]
+    for i, option in enumerate(options):
+        if i == len(options) - 1:
+            lines.append(f"  0. {option}")
+        else:
+            lines.append(f"  {i + 1}. {option}")
+    lines.append("")
+    return lines
+
+
+def write_lines(lines: List[str]) -> None:
+    """Выводит накопленные строки экрана одной записью."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def print_header(title: str):
     """Печатает заголовок меню."""
-    print()
-    print("=" * 50)
-    print(f"  {title}")
-    print("=" * 50)
+    write_lines(header_lines(title))
 
 
 def print_menu(options: list):
     """Печатает пункты меню."""
-    print()
-    for i, option in enumerate(options):
-        if i == len(options) - 1:
-            print(f"  0. {option}")
+    write_lines(menu_lines(options))
+
+
+def _dialog_type_order(dialog: Dict[str, Any]) -> int:
+    """Порядок типа диалога для сортировки: канал, группа, личный."""
+    if dialog.get('is_channel'):
+        return 0
+    if dialog.get('is_group'):
+        return 1
+    return 2
+
+
+def _dialog_name_key(dialog: Dict[str, Any]) -> str:
+    return (dialog.get('name') or '').lower()
+
+
+def _dialog_id_key(dialog: Dict[str, Any]) -> int:
+    return dialog['id']
+
+
+def _dialog_type_name_key(dialog: Dict[str, Any]) -> Tuple[int, str]:
+    return (_dialog_type_order(dialog), _dialog_name_key(dialog))
+
+
+def _dialog_type_id_key(dialog: Dict[str, Any]) -> Tuple[int, int]:
+    return (_dialog_type_order(dialog), dialog['id'])
+
+
+def _dialog_selected_key(selected_set: FrozenSet[int], dialog: Dict[str, Any]) -> int:
+    return 0 if dialog['id'] in selected_set else 1
+
+
+def _dialog_type_selected_key(selected_set: FrozenSet[int],
+                              dialog: Dict[str, Any]) -> Tuple[int, int, int]:
+    return (_dialog_type_order(dialog), 0 if dialog['id'] in selected_set else 1, dialog['id'])
+
+
+# Ключи сортировки диалогов по channels_sort_type
+_DIALOG_SORT_KEYS: Dict[SortType, Callable[[Dict[str, Any]], Any]] = {
+    SortType.TYPE: _dialog_type_name_key,
+    SortType.TYPE_NAME: _dialog_type_name_key,
+    SortType.TYPE_ID: _dialog_type_id_key,
+    SortType.ID: _dialog_id_key,
+    SortType.NAME: _dialog_name_key,
+}
+
+# Ключи, зависящие от множества выбранных каналов (первый аргумент — selected_set)
+_DIALOG_SELECTED_SORT_KEYS: Dict[SortType, Callable[[FrozenSet[int], Dict[str, Any]], Any]] = {
+    SortType.SELECTED: _dialog_selected_key,
+    SortType.TYPE_SELECTED: _dialog_type_selected_key,
+}
+
+# Названия видов сортировки для меню
+_SORT_TYPE_NAMES: Dict[SortType, str] = {
+    SortType.NONE: "Без сортировки",
+    SortType.TYPE: "По Типу",
+    SortType.ID: "По ID",
+    SortType.NAME: "По Названию",
+    SortType.SELECTED: "По Выбранным",
+    SortType.TYPE_ID: "По Типу + По ID",
+    SortType.TYPE_NAME: "По Типу + По Названию",
+    SortType.TYPE_SELECTED: "По Типу + По Выбранным",
+}
+
+
+async def ainput(prompt: str = "") -> str:
+    """
+    Асинхронный input(): читает строку в фоновом потоке, не блокируя цикл событий.
+    
+    Поток — демон, чтобы незавершённый ввод (например, после Ctrl+C)
+    не задерживал выход из программы.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(result: Optional[str], error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def reader() -> None:
+        try:
+            result = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(resolve, None, e)
         else:
-            print(f"  {i + 1}. {option}")
-    print()
+            loop.call_soon_threadsafe(resolve, result, None)
+    
+    threading.Thread(target=reader, daemon=True).start()
+    return await future
 
 
-def get_choice(max_choice: int) -> int:
+async def get_choice(max_choice: int) -> int:
     """Получает выбор пользователя."""
     while True:
         try:
-            choice = input("Выберите пункт: ").strip()
+            choice = (await ainput("Выберите пункт: ")).strip()
             if choice == '':
                 return -1
             num = int(choice)
@@ -58,14 +177,22 @@ def get_choice(max_choice: int) -> int:
             print("Введите число")
 
 
-def wait_for_enter():
+async def wait_for_enter():
     """Ожидает нажатия Enter."""
-    input("\nНажмите Enter для продолжения...")
+    await ainput("\nНажмите Enter для продолжения...")
 
 
 class InteractiveMode:
     """Класс интерактивного режима."""
     
+    # Время жизни закэшированной информации о диалоге (секунды)
+    DIALOG_INFO_TTL = 60.0
+    # Максимум каналов, загружаемых одновременно в fetch_messages_menu
+    # (у каждого своя пауза между порциями — защита от FloodWait)
+    FETCH_CHANNELS_CONCURRENCY = 3
+    # Максимум одновременных запросов при предзагрузке информации о диалогах страницы
+    DIALOG_INFO_PREFETCH_CONCURRENCY = 4
+    
     def __init__(self, api_id: int, api_hash: str):
         self.api_id = api_id
         self.api_hash = api_hash
@@ -78,6 +205,19 @@ class InteractiveMode:
         self.dialogs_name_col_width = int(os.environ.get('DIALOGS_NAME_COL_WIDTH', '30'))
         if self.dialogs_name_col_width < 10:
             self.dialogs_name_col_width = 10
+        # Шаблон строки таблицы диалогов: ширина колонки известна заранее
+        self._dialog_row_fmt = (
+            "{:<4} {:<7} {:<10} {:<15} {:<" + str(self.dialogs_name_col_width) + "}"
+        )
+        # Кэш get_dialog_info: channel_id -> (время получения, информация)
+        self._dialog_info_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        # Фоновые задачи предзагрузки информации о диалогах текущей страницы
+        self._prefetch_tasks: List[asyncio.Task] = []
+        self._prefetch_semaphore = asyncio.Semaphore(self.DIALOG_INFO_PREFETCH_CONCURRENCY)
+        # Подготовленный список выбранных каналов для manage_selected_channels
+        # и ключ (выбранные ID, вид сортировки), для которого он построен
+        self._selected_dialogs_cache: Optional[List[Dict[str, Any]]] = None
+        self._selected_dialogs_cache_key: Optional[Tuple[Tuple[int, ...], SortType]] = None
 
     @staticmethod
     def _get_dialog_type_label(dialog: Dict[str, Any]) -> str:
@@ -93,13 +233,82 @@ class InteractiveMode:
         """Обрезает строку под ширину колонки (с многоточием)."""
         if width <= 0:
             return ""
-        s = (text or "-").replace("\n", " ")
+        s = text or "-"
+        # Частый случай: короткая строка без переводов — возвращаем как есть
+        if "\n" not in s and len(s) <= width:
+            return s
+        s = s.replace("\n", " ")
         if len(s) <= width:
             return s
         if width == 1:
             return "…"
         return s[: width - 1] + "…"
     
+    def _fresh_dialog_info(self, dialog_id: int) -> Optional[Dict[str, Any]]:
+        """Возвращает информацию о диалоге из кэша, если запись не старше DIALOG_INFO_TTL."""
+        cached = self._dialog_info_cache.get(dialog_id)
+        if cached is not None and time.monotonic() - cached[0] < self.DIALOG_INFO_TTL:
+            return cached[1]
+        return None
+    
+    async def _get_dialog_info_cached(self, dialog_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает информацию о диалоге, используя кэш с TTL.
+        
+        Неудачные запросы (None) не кэшируются.
+        """
+        cached = self._fresh_dialog_info(dialog_id)
+        if cached is not None:
+            return cached
+        info = await self.telegram.get_dialog_info(dialog_id)
+        if info is not None:
+            self._dialog_info_cache[dialog_id] = (time.monotonic(), info)
+        return info
+    
+    def _prepare_dialog_rows(self, dialogs: List[Dict[str, Any]]) -> None:
+        """
+        Один раз вычисляет для диалогов подпись типа и обрезанное название.
+        
+        Результат кладётся в поля _type_label и _fitted_name, которые читает
+        отрисовка таблицы при каждой перерисовке страницы.
+        """
+        fit = self._fit_text
+        get_label = self._get_dialog_type_label
+        width = self.dialogs_name_col_width
+        for dialog in dialogs:
+            dialog['_type_label'] = get_label(dialog)
+            dialog['_fitted_name'] = fit(dialog.get('name') or "-", width)
+    
+    def _prefetch_dialog_info(self, dialog_ids: List[int]) -> None:
+        """
+        Запускает фоновую загрузку информации о диалогах в кэш.
+        
+        Запрашиваются только диалоги без свежей записи в кэше, не больше
+        DIALOG_INFO_PREFETCH_CONCURRENCY одновременно. Незавершённые задачи
+        предыдущей предзагрузки отменяются.
+        """
+        self._cancel_prefetch()
+        self._prefetch_tasks = [
+            asyncio.create_task(self._prefetch_one_dialog_info(dialog_id))
+            for dialog_id in dialog_ids
+            if self._fresh_dialog_info(dialog_id) is None
+        ]
+    
+    async def _prefetch_one_dialog_info(self, dialog_id: int) -> None:
+        """Загружает информацию об одном диалоге в кэш (ошибки игнорируются)."""
+        async with self._prefetch_semaphore:
+            try:
+                await self._get_dialog_info_cached(dialog_id)
+            except Exception:
+                # Предзагрузка необязательна: при показе информация запросится снова
+                pass
+    
+    def _cancel_prefetch(self) -> None:
+        """Отменяет незавершённые задачи предзагрузки."""
+        for task in self._prefetch_tasks:
+            task.cancel()
+        self._prefetch_tasks = []
+    
     async def run(self):
         """Запускает интерактивный режим."""
         async with TelegramClientWrapper(self.api_id, self.api_hash) as tg:
@@ -129,7 +338,7 @@ class InteractiveMode:
                 "Выход"
             ])
             
-            choice = get_choice(4)
+            choice = await get_choice(4)
             
             if choice == 0:
                 print("\nДо свидания!")
@@ -157,7 +366,7 @@ class InteractiveMode:
         print(f"  Телефон: {me['phone']}")
         print(f"  Premium: {'Да' if me['is_premium'] else 'Нет'}")
         
-        wait_for_enter()
+        await wait_for_enter()
     
     async def channels_menu(self):
         """Меню каналов и чатов."""
@@ -179,7 +388,7 @@ class InteractiveMode:
                 "Назад"
             ])
             
-            choice = get_choice(6)
+            choice = await get_choice(6)
             
             if choice == 0:
                 break
@@ -217,73 +426,45 @@ class InteractiveMode:
                 "Назад",
             ])
 
-            choice = get_choice(3)
+            choice = await get_choice(3)
             if choice == 0:
                 break
             elif choice == 1:
                 self.config.set_messages_sort_order("telegram")
                 print("\nСортировка вывода установлена: telegram")
-                wait_for_enter()
+                await wait_for_enter()
             elif choice == 2:
                 self.config.set_messages_sort_order("id_asc")
                 print("\nСортировка вывода установлена: id_asc")
-                wait_for_enter()
+                await wait_for_enter()
             elif choice == 3:
                 self.config.set_messages_sort_order("id_desc")
                 print("\nСортировка вывода установлена: id_desc")
-                wait_for_enter()
+                await wait_for_enter()
     
-    def _sort_dialogs(self, dialogs: List[Dict[str, Any]], selected: List[int]) -> List[Dict[str, Any]]:
+    def _sort_dialogs(self, dialogs: List[Dict[str, Any]],
+                      selected_set: FrozenSet[int]) -> List[Dict[str, Any]]:
         """
         Применяет сортировку к списку диалогов согласно настройкам.
         
         Args:
             dialogs: Список диалогов
-            selected: Список ID выбранных каналов
+            selected_set: Множество ID выбранных каналов
             
         Returns:
             Отсортированный список диалогов
         """
         sort_type = self.config.get_channels_sort_type()
-        selected_set = set(selected)
-
-        def get_type_order(d: Dict[str, Any]) -> int:
-            if d.get('is_channel'):
-                return 0
-            if d.get('is_group'):
-                return 1
-            return 2
-        
-        if sort_type == "none":
-            return dialogs
-        
-        if sort_type == "selected":
-            selected_dialogs = [d for d in dialogs if d['id'] in selected_set]
-            other_dialogs = [d for d in dialogs if d['id'] not in selected_set]
-            return selected_dialogs + other_dialogs
-        
-        if sort_type == "type":
-            return sorted(dialogs, key=lambda d: (get_type_order(d), d.get('name', '').lower()))
-        
-        if sort_type == "type_id":
-            return sorted(dialogs, key=lambda d: (get_type_order(d), d['id']))
-
-        if sort_type == "type_name":
-            return sorted(dialogs, key=lambda d: (get_type_order(d), (d.get('name') or '').lower()))
-
-        if sort_type == "type_selected":
-            return sorted(
-                dialogs,
-                key=lambda d: (get_type_order(d), 0 if d['id'] in selected_set else 1, d['id'])
-            )
-
-        if sort_type == "id":
-            return sorted(dialogs, key=lambda d: d['id'])
-        
-        if sort_type == "name":
-            return sorted(dialogs, key=lambda d: d.get('name', '').lower())
         
-        return dialogs
+        key = _DIALOG_SORT_KEYS.get(sort_type)
+        if key is None:
+            selected_key = _DIALOG_SELECTED_SORT_KEYS.get(sort_type)
+            if selected_key is None:
+                # SortType.NONE — без сортировки
+                return dialogs
+            key = partial(selected_key, selected_set)
+        # sorted() стабилен, поэтому SELECTED сохраняет исходный порядок внутри групп
+        return sorted(dialogs, key=key)
     
     async def channels_sort_settings_menu(self):
         """Меню настройки сортировки списка каналов."""
@@ -292,156 +473,154 @@ class InteractiveMode:
             print_header("Настройка сортировки списка")
             
             current_sort = self.config.get_channels_sort_type()
-            sort_names = {
-                "none": "Без сортировки",
-                "type": "По Типу",
-                "id": "По ID",
-                "name": "По Названию",
-                "selected": "По Выбранным",
-                "type_id": "По Типу + По ID",
-                "type_name": "По Типу + По Названию",
-                "type_selected": "По Типу + По Выбранным",
-            }
-            current_name = sort_names.get(current_sort, "Неизвестно")
+            current_name = _SORT_TYPE_NAMES.get(current_sort, "Неизвестно")
             
             print(f"\n  Текущая сортировка: {current_name}")
             
-            print_menu([
-                "Без сортировки",
-                "По Типу",
-                "По ID",
-                "По Названию",
-                "По Выбранным",
-                "По Типу + По ID",
-                "По Типу + По Названию",
-                "По Типу + По Выбранным",
-                "Назад"
-            ])
+            # Пункты меню идут в порядке значений SortType
+            print_menu([_SORT_TYPE_NAMES[sort_type] for sort_type in SortType] + ["Назад"])
             
-            choice = get_choice(8)
+            choice = await get_choice(len(SortType))
             
             if choice == 0:
                 break
-            elif choice == 1:
-                self.config.set_channels_sort_type("none")
-                print("\nСортировка установлена: Без сортировки")
-                wait_for_enter()
-            elif choice == 2:
-                self.config.set_channels_sort_type("type")
-                print("\nСортировка установлена: По Типу")
-                wait_for_enter()
-            elif choice == 3:
-                self.config.set_channels_sort_type("id")
-                print("\nСортировка установлена: По ID")
-                wait_for_enter()
-            elif choice == 4:
-                self.config.set_channels_sort_type("name")
-                print("\nСортировка установлена: По Названию")
-                wait_for_enter()
-            elif choice == 5:
-                self.config.set_channels_sort_type("selected")
-                print("\nСортировка установлена: По Выбранным")
-                wait_for_enter()
-            elif choice == 6:
-                self.config.set_channels_sort_type("type_id")
-                print("\nСортировка установлена: По Типу + По ID")
-                wait_for_enter()
-            elif choice == 7:
-                self.config.set_channels_sort_type("type_name")
-                print("\nСортировка установлена: По Типу + По Названию")
-                wait_for_enter()
-            elif choice == 8:
-                self.config.set_channels_sort_type("type_selected")
-                print("\nСортировка установлена: По Типу + По Выбранным")
-                wait_for_enter()
+            if choice > 0:
+                sort_type = SortType(choice - 1)
+                self.config.set_channels_sort_type(sort_type)
+                print(f"\nСортировка установлена: {_SORT_TYPE_NAMES[sort_type]}")
+                await wait_for_enter()
     
     async def show_all_dialogs(self):
         """Показывает все диалоги с постраничной навигацией."""
         print("\nЗагрузка...")
-        dialogs = await self.telegram.get_dialogs()
+        selected_set = frozenset(self.config.get_selected_channels())
+        # Без сортировки порядок задаёт Telegram: диалоги загружаются в фоне,
+        # страница показывается, как только пришли её диалоги.
+        # Для остальных видов сортировки нужен полный список.
+        paged = self.config.get_channels_sort_type() == SortType.NONE
+        dialogs: List[Dict[str, Any]] = []
+        if paged:
+            total = await self.telegram.get_dialogs_count()
+            progress = asyncio.Condition()
+            finished = False
+            
+            async def fill():
+                nonlocal finished
+                try:
+                    async for dialog in self.telegram.iter_dialogs():
+                        self._prepare_dialog_rows([dialog])
+                        async with progress:
+                            dialogs.append(dialog)
+                            progress.notify_all()
+                finally:
+                    async with progress:
+                        finished = True
+                        progress.notify_all()
+        else:
+            dialogs = self._sort_dialogs(await self.telegram.get_dialogs(), selected_set)
+            self._prepare_dialog_rows(dialogs)
+            total = len(dialogs)
         
-        if not dialogs:
+        if not total:
             clear_screen()
             print_header("Все каналы и чаты")
             print("\n  Нет доступных диалогов")
-            wait_for_enter()
+            await wait_for_enter()
             return
         
-        selected = self.config.get_selected_channels()
-        # Применяем сортировку
-        dialogs = self._sort_dialogs(dialogs, selected)
-        
-        total_pages = (len(dialogs) + self.dialogs_per_page - 1) // self.dialogs_per_page
+        total_pages = (total + self.dialogs_per_page - 1) // self.dialogs_per_page
         current_page = 1
+        prefetched_page = None
+        page_dialogs: List[Dict[str, Any]] = []
+        # Шапка таблицы не меняется между страницами
+        row_fmt = self._dialog_row_fmt
+        header = row_fmt.format('#', 'Выбран', 'Тип', 'ID', 'Название')
+        sep = "-" * len(header)
+        fill_task = asyncio.create_task(fill()) if paged else None
         
-        while True:
-            clear_screen()
-            print_header("Все каналы и чаты")
+        try:
+            while True:
+                # Вычисляем диапазон для текущей страницы
+                start_idx = (current_page - 1) * self.dialogs_per_page
+                end_idx = start_idx + self.dialogs_per_page
+                if fill_task is not None:
+                    async with progress:
+                        await progress.wait_for(lambda: finished or len(dialogs) >= end_idx)
+                    if finished:
+                        # Пробрасывает ошибку загрузки, если она была
+                        await fill_task
+                        fill_task = None
+                        # Счётчик Telegram приблизительный — уточняем по факту
+                        total = len(dialogs)
+                        total_pages = max(1, (total + self.dialogs_per_page - 1) // self.dialogs_per_page)
+                        if current_page > total_pages:
+                            current_page = total_pages
+                            start_idx = (current_page - 1) * self.dialogs_per_page
+                            end_idx = start_idx + self.dialogs_per_page
+                page_dialogs = dialogs[start_idx:end_idx]
             
-            # Вычисляем диапазон для текущей страницы
-            start_idx = (current_page - 1) * self.dialogs_per_page
-            end_idx = min(start_idx + self.dialogs_per_page, len(dialogs))
-            page_dialogs = dialogs[start_idx:end_idx]
+                # Пока пользователь читает страницу, подгружаем информацию о её диалогах
+                if prefetched_page != current_page:
+                    self._prefetch_dialog_info([d['id'] for d in page_dialogs])
+                    prefetched_page = current_page
             
-            print(f"\nСтраница {current_page} из {total_pages} (всего диалогов: {len(dialogs)})")
-            header = (
-                f"{'#':<4} "
-                f"{'Выбран':<7} "
-                f"{'Тип':<10} "
-                f"{'ID':<15} "
-                f"{'Название':<{self.dialogs_name_col_width}}"
-            )
-            print("\n" + header)
-            print("-" * len(header))
+                # Экран собирается целиком и выводится одной записью
+                lines = header_lines("Все каналы и чаты")
+                lines.append(f"\nСтраница {current_page} из {total_pages} (всего диалогов: {total})")
+                lines.append("\n" + header)
+                lines.append(sep)
             
-            for i, dialog in enumerate(page_dialogs, start=start_idx + 1):
-                dtype = self._get_dialog_type_label(dialog)
-                name = self._fit_text(dialog.get('name') or "-", self.dialogs_name_col_width)
-                is_selected = "✓" if dialog['id'] in selected else ""
-                print(
-                    f"{i:<4} "
-                    f"{is_selected:<7} "
-                    f"{dtype:<10} "
-                    f"{dialog['id']:<15} "
-                    f"{name:<{self.dialogs_name_col_width}}"
-                )
+                for i, dialog in enumerate(page_dialogs, start=start_idx + 1):
+                    is_selected = "✓" if dialog['id'] in selected_set else ""
+                    lines.append(row_fmt.format(
+                        i, is_selected, dialog['_type_label'], dialog['id'], dialog['_fitted_name']
+                    ))
             
-            # Навигация
-            print("\n" + "-" * len(header))
-            if total_pages > 1:
-                nav_options = []
-                nav_actions = []
-
-                if current_page < total_pages:
-                    nav_options.append("Следующая страница")
-                    nav_actions.append('next')
-                
-                if current_page > 1:
-                    nav_options.append("Предыдущая страница")
-                    nav_actions.append('prev')
+                # Навигация
+                lines.append("\n" + sep)
+                if total_pages > 1:
+                    nav_options = []
+                    nav_actions = []
+
+                    if current_page < total_pages:
+                        nav_options.append("Следующая страница")
+                        nav_actions.append('next')
                 
-                print("\nНавигация:")
-                for i, option in enumerate(nav_options, 1):
-                    print(f"  {i}. {option}")
-                print("  0. Назад")
+                    if current_page > 1:
+                        nav_options.append("Предыдущая страница")
+                        nav_actions.append('prev')
                 
-                choice = get_choice(len(nav_options))
+                    lines.append("\nНавигация:")
+                    for i, option in enumerate(nav_options, 1):
+                        lines.append(f"  {i}. {option}")
+                    lines.append("  0. Назад")
+                    clear_screen()
+                    write_lines(lines)
                 
-                if choice == 0:
-                    break
+                    choice = await get_choice(len(nav_options))
                 
-                if choice <= len(nav_actions):
-                    action = nav_actions[choice - 1]
-                    if action == 'prev':
-                        current_page -= 1
-                    elif action == 'next':
-                        current_page += 1
-                    elif action == 'back':
+                    if choice == 0:
                         break
-            else:
-                print("\nНажмите Enter для возврата...")
-                input()
-                break
+                
+                    if choice <= len(nav_actions):
+                        action = nav_actions[choice - 1]
+                        if action == 'prev':
+                            current_page -= 1
+                        elif action == 'next':
+                            current_page += 1
+                        elif action == 'back':
+                            break
+                else:
+                    lines.append("\nНажмите Enter для возврата...")
+                    clear_screen()
+                    write_lines(lines)
+                    await ainput()
+                    break
+        finally:
+            # Фоновые загрузки нужны только этому экрану
+            self._cancel_prefetch()
+            if fill_task is not None:
+                fill_task.cancel()
     
     async def show_dialog_info(self):
         """Показывает информацию о конкретном диалоге."""
@@ -449,18 +628,18 @@ class InteractiveMode:
         print_header("Информация о канале/чате")
         
         try:
-            dialog_id = int(input("\nВведите ID канала/чата: "))
+            dialog_id = int(await ainput("\nВведите ID канала/чата: "))
         except ValueError:
             print("Неверный ID!")
-            wait_for_enter()
+            await wait_for_enter()
             return
         
         print("\nЗагрузка...")
-        info = await self.telegram.get_dialog_info(dialog_id)
+        info = await self._get_dialog_info_cached(dialog_id)
         
         if not info:
             print("Канал/чат не найден!")
-            wait_for_enter()
+            await wait_for_enter()
             return
         
         clear_screen()
@@ -484,7 +663,7 @@ class InteractiveMode:
         if 'verified' in info:
             print(f"  Верифицирован: {'Да' if info['verified'] else 'Нет'}")
         
-        wait_for_enter()
+        await wait_for_enter()
     
     async def manage_selected_channels(self):
         """Управление выбранными каналами."""
@@ -493,64 +672,42 @@ class InteractiveMode:
             print_header("Выбранные каналы")
             
             selected = self.config.get_selected_channels()
+            lines: List[str] = []
             
             if selected:
-                selected_set = set(selected)
-                # Получаем информацию о всех выбранных каналах
-                selected_dialogs = []
-                for channel_id in selected:
-                    info = await self.telegram.get_dialog_info(channel_id)
-                    if info:
-                        dialog_type = info.get('type', '')
-                        is_channel = info.get('is_broadcast', False) or dialog_type == 'Channel'
-                        is_group = dialog_type == 'Chat' or info.get('is_megagroup', False)
-                        is_user = dialog_type == 'User'
-                        
-                        dialog = {
-                            'id': channel_id,
-                            'name': info.get('title', info.get('first_name', 'Неизвестно')),
-                            'is_channel': is_channel,
-                            'is_group': is_group,
-                            'is_user': is_user
-                        }
-                        selected_dialogs.append(dialog)
-                
-                # Применяем сортировку
-                selected_dialogs = self._sort_dialogs(selected_dialogs, selected)
+                selected_set = frozenset(selected)
+                # Порядок selected важен для SortType.NONE, поэтому ключ не сортируется
+                cache_key = (tuple(selected), self.config.get_channels_sort_type())
+                if self._selected_dialogs_cache is None or self._selected_dialogs_cache_key != cache_key:
+                    self._selected_dialogs_cache = await self._build_selected_dialogs(
+                        selected, selected_set
+                    )
+                    self._selected_dialogs_cache_key = cache_key
+                selected_dialogs = self._selected_dialogs_cache
                 
-                print("\nТекущие выбранные каналы:")
-                header = (
-                    f"{'#':<4} "
-                    f"{'Выбран':<7} "
-                    f"{'Тип':<10} "
-                    f"{'ID':<15} "
-                    f"{'Название':<{self.dialogs_name_col_width}}"
-                )
-                print("\n" + header)
-                print("-" * len(header))
+                lines.append("\nТекущие выбранные каналы:")
+                row_fmt = self._dialog_row_fmt
+                header = row_fmt.format('#', 'Выбран', 'Тип', 'ID', 'Название')
+                lines.append("\n" + header)
+                lines.append("-" * len(header))
 
                 for i, dialog in enumerate(selected_dialogs, 1):
-                    dtype = self._get_dialog_type_label(dialog)
-                    name = self._fit_text(dialog.get('name') or "-", self.dialogs_name_col_width)
                     is_selected = "✓" if dialog.get('id') in selected_set else ""
-                    print(
-                        f"{i:<4} "
-                        f"{is_selected:<7} "
-                        f"{dtype:<10} "
-                        f"{dialog['id']:<15} "
-                        f"{name:<{self.dialogs_name_col_width}}"
-                    )
+                    lines.append(row_fmt.format(
+                        i, is_selected, dialog['_type_label'], dialog['id'], dialog['_fitted_name']
+                    ))
             else:
-                print("\n  Нет выбранных каналов")
+                lines.append("\n  Нет выбранных каналов")
             
-            print_menu([
+            lines.extend(menu_lines([
                 "Добавить канал",
                 "Удалить канал",
                 "Очистить все",
                 "Назад"
-            ])
+            ]))
+            write_lines(lines)
             
-            choice = get_choice(3)
+            choice = await get_choice(3)
             
             if choice == 0:
                 break
@@ -560,32 +717,73 @@ class InteractiveMode:
                 await self.remove_channel()
             elif choice == 3:
                 self.config.set_selected_channels([])
+                self._selected_dialogs_cache = None
                 print("\nВсе каналы удалены из выбранных")
-                wait_for_enter()
+                await wait_for_enter()
+    
+    async def _build_selected_dialogs(self, selected: List[int],
+                                      selected_set: FrozenSet[int]) -> List[Dict[str, Any]]:
+        """
+        Загружает информацию о выбранных каналах и готовит строки таблицы.
+        
+        Args:
+            selected: Список ID выбранных каналов
+            selected_set: Множество ID выбранных каналов
+            
+        Returns:
+            Отсортированный список диалогов
+        """
+        # Получаем информацию о всех выбранных каналах (запросы параллельно)
+        infos = await asyncio.gather(
+            *(self._get_dialog_info_cached(channel_id) for channel_id in selected)
+        )
+        selected_dialogs = []
+        for channel_id, info in zip(selected, infos):
+            if info:
+                dialog_type = info.get('type', '')
+                is_channel = info.get('is_broadcast', False) or dialog_type == 'Channel'
+                is_group = dialog_type == 'Chat' or info.get('is_megagroup', False)
+                is_user = dialog_type == 'User'
+                
+                dialog = {
+                    'id': channel_id,
+                    'name': info.get('title', info.get('first_name', 'Неизвестно')),
+                    'is_channel': is_channel,
+                    'is_group': is_group,
+                    'is_user': is_user
+                }
+                selected_dialogs.append(dialog)
+        
+        # Применяем сортировку
+        selected_dialogs = self._sort_dialogs(selected_dialogs, selected_set)
+        self._prepare_dialog_rows(selected_dialogs)
+        return selected_dialogs
     
     async def add_channel(self):
         """Добавляет канал в выбранные."""
         try:
-            channel_id = int(input("\nВведите ID канала: "))
+            channel_id = int(await ainput("\nВведите ID канала: "))
         except ValueError:
             print("Неверный ID!")
-            wait_for_enter()
+            await wait_for_enter()
             return
         
-        # Проверяем, что канал существует
-        info = await self.telegram.get_dialog_info(channel_id)
+        # Проверяем, что канал существует (свежие данные, без кэша)
+        self._dialog_info_cache.pop(channel_id, None)
+        info = await self._get_dialog_info_cached(channel_id)
         if not info:
             print("Канал не найден!")
-            wait_for_enter()
+            await wait_for_enter()
             return
         
         if self.config.add_channel(channel_id):
+            self._selected_dialogs_cache = None
             name = info.get('title', info.get('first_name', 'Неизвестно'))
             print(f"\nКанал '{name}' добавлен в выбранные")
         else:
             print("\nКанал уже в списке выбранных")
         
-        wait_for_enter()
+        await wait_for_enter()
     
     async def remove_channel(self):
         """Удаляет канал из выбранных."""
@@ -593,22 +791,24 @@ class InteractiveMode:
         
         if not selected:
             print("\nНет выбранных каналов")
-            wait_for_enter()
+            await wait_for_enter()
             return
         
         try:
-            channel_id = int(input("\nВведите ID канала для удаления: "))
+            channel_id = int(await ainput("\nВведите ID канала для удаления: "))
         except ValueError:
             print("Неверный ID!")
-            wait_for_enter()
+            await wait_for_enter()
             return
         
         if self.config.remove_channel(channel_id):
+            self._dialog_info_cache.pop(channel_id, None)
+            self._selected_dialogs_cache = None
             print("\nКанал удалён из выбранных")
         else:
             print("\nКанал не найден в списке")
         
-        wait_for_enter()
+        await wait_for_enter()
     
     async def fetch_messages_menu(self):
         """Меню получения сообщений."""
@@ -619,7 +819,7 @@ class InteractiveMode:
         
         if not selected:
             print("\nСначала выберите каналы!")
-            wait_for_enter()
+            await wait_for_enter()
             return
         
         print_menu([
@@ -630,12 +830,12 @@ class InteractiveMode:
             "Назад"
         ])
         
-        choice = get_choice(4)
+        choice = await get_choice(4)
         
         if choice == 0:
             return
         
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         
         if choice == 1:
             date_from = now - timedelta(hours=1)
@@ -645,54 +845,76 @@ class InteractiveMode:
             date_from = now - timedelta(weeks=1)
         elif choice == 4:
             try:
-                hours = int(input("\nСколько часов назад? "))
+                hours = int(await ainput("\nСколько часов назад? "))
                 date_from = now - timedelta(hours=hours)
             except ValueError:
                 print("Неверное значение!")
-                wait_for_enter()
+                await wait_for_enter()
                 return
         
         print("\nПолучение сообщений...")
         
-        total_messages = 0
-        for channel_id in selected:
-            messages = await self.telegram.fetch_messages_by_date(
-                channel_id,
-                date_from,
-                now,
-                limit=self.config.get_fetch_messages_limit(),
-                pause_seconds=self.config.get_fetch_messages_pause_seconds(),
-            )
-            
-            # Сохраняем в базу
-            for msg in messages:
-                sender_id = None
-                if msg['sender']:
-                    sender_id = self.database.get_or_create_sender(
-                        msg['sender']['id'],
-                        msg['sender']['first_name'],
-                        msg['sender']['last_name'],
-                        msg['sender']['username']
-                    )
-                
-                self.database.save_message(
-                    telegram_id=msg['telegram_id'],
-                    channel_id=msg['channel_id'],
-                    content=msg['content'],
-                    date=msg['date'],
-                    sender_id=sender_id,
-                    reply_to_msg_id=msg['reply_to_msg_id'],
-                    reactions_count=msg['reactions_count'],
-                    raw_json=msg['raw_json']
+        limit = self.config.get_fetch_messages_limit()
+        pause_seconds = self.config.get_fetch_messages_pause_seconds()
+        loop = asyncio.get_running_loop()
+        # Каналы загружаются параллельно (не больше FETCH_CHANNELS_CONCURRENCY сразу);
+        # запись в БД идёт в отдельном потоке-писателе по мере поступления порций,
+        # не дожидаясь остальных каналов.
+        queue: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.FETCH_CHANNELS_CONCURRENCY)
+        
+        async def writer(executor: ThreadPoolExecutor) -> None:
+            while (batch := await queue.get()) is not None:
+                await loop.run_in_executor(executor, self._save_messages, batch)
+        
+        async def fetch_and_enqueue(channel_id: int) -> int:
+            async with semaphore:
+                messages = await self.telegram.fetch_messages_by_date(
+                    channel_id,
+                    date_from,
+                    now,
+                    limit=limit,
+                    pause_seconds=pause_seconds,
                 )
-            
-            total_messages += len(messages)
-            info = await self.telegram.get_dialog_info(channel_id)
+            await queue.put(messages)
+            info = await self._get_dialog_info_cached(channel_id)
             name = info.get('title', 'Неизвестно') if info else 'Неизвестно'
             print(f"  {name}: {len(messages)} сообщений")
+            return len(messages)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            writer_task = asyncio.create_task(writer(executor))
+            try:
+                counts = await asyncio.gather(
+                    *(fetch_and_enqueue(channel_id) for channel_id in selected)
+                )
+            finally:
+                await queue.put(None)
+                await writer_task
+        total_messages = sum(counts)
         
         print(f"\nВсего получено: {total_messages} сообщений")
-        wait_for_enter()
+        await wait_for_enter()
+    
+    def _save_messages(self, messages: List[Dict[str, Any]]) -> None:
+        """Сохраняет сообщения канала в БД вместе с отправителями (синхронно)."""
+        # Повторы отправителя сливает get_or_create_senders_bulk
+        senders = [msg['sender'] for msg in messages if msg['sender']]
+        sender_ids = self.database.get_or_create_senders_bulk(senders)
+        
+        self.database.save_messages_bulk([
+            {
+                'telegram_id': msg['telegram_id'],
+                'channel_id': msg['channel_id'],
+                'content': msg['content'],
+                'date': msg['date'],
+                'sender_id': sender_ids.get(msg['sender']['id']) if msg['sender'] else None,
+                'reply_to_msg_id': msg['reply_to_msg_id'],
+                'reactions_count': msg['reactions_count'],
+                'raw_json': msg['raw_json'],
+            }
+            for msg in messages
+        ])
     
     async def senders_menu(self):
         """Меню отправителей."""
@@ -700,25 +922,28 @@ class InteractiveMode:
         print_header("Отправители")
         
         senders = self.database.get_senders_list()
+        total_senders = len(senders)
         
-        if not senders:
+        if not total_senders:
             print("\n  Нет данных об отправителях.")
             print("  Сначала получите сообщения из каналов.")
-            wait_for_enter()
+            await wait_for_enter()
             return
         
-        print(f"\n{'#':<4} {'ID':<15} {'Имя':<20} {'Username':<20} {'Сообщений'}")
-        print("-" * 70)
-        
+        lines = [
+            f"\n{'#':<4} {'ID':<15} {'Имя':<20} {'Username':<20} {'Сообщений'}",
+            "-" * 70,
+        ]
         for i, sender in enumerate(senders[:30], 1):
             name = f"{sender['first_name'] or ''} {sender['last_name'] or ''}".strip() or '-'
             username = f"@{sender['username']}" if sender['username'] else '-'
-            print(f"{i:<4} {sender['telegram_id']:<15} {name[:18]:<20} {username[:18]:<20} {sender['message_count']}")
+            lines.append(f"{i:<4} {sender['telegram_id']:<15} {name[:18]:<20} {username[:18]:<20} {sender['message_count']}")
         
-        if len(senders) > 30:
-            print(f"\n... и ещё {len(senders) - 30} отправителей")
+        if total_senders > 30:
+            lines.append(f"\n... и ещё {total_senders - 30} отправителей")
+        write_lines(lines)
         
-        wait_for_enter()
+        await wait_for_enter()
     
     async def statistics_menu(self):
         """Меню статистики."""
@@ -727,30 +952,38 @@ class InteractiveMode:
         
         stats = self.database.get_statistics()
         
-        print(f"\n  Всего сообщений: {stats['total_messages']}")
-        print(f"  Всего отправителей: {stats['total_senders']}")
-        print(f"  Всего каналов: {stats['total_channels']}")
+        lines = [
+            f"\n  Всего сообщений: {stats['total_messages']}",
+            f"  Всего отправителей: {stats['total_senders']}",
+            f"  Всего каналов: {stats['total_channels']}",
+        ]
         
         if stats['first_message_date']:
-            print(f"\n  Первое сообщение: {stats['first_message_date']}")
-            print(f"  Последнее сообщение: {stats['last_message_date']}")
+            lines.append(f"\n  Первое сообщение: {stats['first_message_date']}")
+            lines.append(f"  Последнее сообщение: {stats['last_message_date']}")
         
-        print("\n--- По каналам ---")
+        lines.append("\n--- По каналам ---")
+        # Общая часть выводится сразу, пока загружаются названия каналов
+        write_lines(lines)
         
         by_channel = self.database.get_message_counts_by_channel()
         
+        lines = []
         if by_channel:
-            for item in by_channel:
-                info = await self.telegram.get_dialog_info(item['channel_id'])
-                name = info.get('title', 'Неизвестно') if info else 'Неизвестно'
-                print(f"\n  {name} (ID: {item['channel_id']})")
-                print(f"    Сообщений: {item['message_count']}")
+            infos = await asyncio.gather(
+                *(self._get_dialog_info_cached(item['channel_id']) for item in by_channel)
+            )
+            for item, info in zip(by_channel, infos):
+                name = (info or {}).get('title', 'Неизвестно')
+                lines.append(f"\n  {name} (ID: {item['channel_id']})")
+                lines.append(f"    Сообщений: {item['message_count']}")
                 if item['first_message']:
-                    print(f"    Период: {item['first_message'][:10]} - {item['last_message'][:10]}")
+                    lines.append(f"    Период: {item['first_message'][:10]} - {item['last_message'][:10]}")
         else:
-            print("\n  Нет данных")
+            lines.append("\n  Нет данных")
+        write_lines(lines)
         
-        wait_for_enter()
+        await wait_for_enter()
 
 
 async def run_interactive_mode(api_id: int, api_hash: str):
@@ -11,22 +11,95 @@ FastAPI сервер для отправки сообщений в Telegram ка
 """
 
 import asyncio
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
 from contextlib import asynccontextmanager
-from typing import Optional
+from operator import itemgetter
+from typing import Optional, Any, Callable, Dict, FrozenSet, Tuple
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from pydantic import BaseModel, ValidationError
 import uvicorn
 
 from core.telegram_client import TelegramClientWrapper
-from core.config import Config
+from core.config import Config, SortType
 from typing import List
 
+# uvloop и httptools необязательны (uvloop не работает на Windows):
+# без них uvicorn использует стандартный asyncio и h11
+try:
+    import uvloop  # noqa: F401
+    _UVICORN_LOOP = "uvloop"
+except ImportError:
+    _UVICORN_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    _UVICORN_HTTP = "httptools"
+except ImportError:
+    _UVICORN_HTTP = "h11"
+
+# orjson необязателен: без него ответы сериализуются стандартным json
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _JSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as _JSONResponse
+
+# msgspec необязателен: без него тело /send разбирается Pydantic
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+logger = logging.getLogger(__name__)
+
+# Фоновый поток, выводящий записи лога из очереди (см. _setup_logging)
+_log_listener: Optional[logging.handlers.QueueListener] = None
 
 # Глобальные переменные для хранения состояния
 _telegram_client: Optional[TelegramClientWrapper] = None
 _api_id: int = 0
 _api_hash: str = ""
+# Конфигурация загружается один раз при старте (см. lifespan)
+_config: Optional[Config] = None
+# Время последней проверки mtime config.json
+_config_checked_at: float = 0.0
+# Выбранные каналы из конфигурации: порядок и множество (обновляются при перечитывании)
+_selected_order: Tuple[int, ...] = ()
+_selected_ids: FrozenSet[int] = frozenset()
+# Как часто проверять, не изменён ли config.json (секунды)
+_CONFIG_CHECK_INTERVAL = 1.0
+# Результат последней проверки авторизации: (время проверки, авторизован ли)
+_auth_cache: Tuple[float, bool] = (0.0, False)
+# Время жизни результата проверки авторизации (секунды)
+_AUTH_CACHE_TTL = 5.0
+
+# Не больше стольких одновременных запросов get_dialog_info (защита от flood wait)
+_DIALOG_INFO_CONCURRENCY = 16
+
+# Кэш get_dialog_info: channel_id -> (время получения, информация)
+_dialog_info_cache: Dict[int, Tuple[float, dict]] = {}
+# Время жизни записи кэша (секунды) и максимальное число записей
+_DIALOG_INFO_TTL = 300.0
+_DIALOG_INFO_CACHE_SIZE = 1024
+
+# Очередь отправки: эндпоинты /send кладут задания, их выполняют фоновые воркеры.
+# При переполнении очереди запрос сразу получает 503.
+_send_queue: Optional[asyncio.Queue] = None
+_send_worker_tasks: List[asyncio.Task] = []
+_SEND_QUEUE_SIZE = 256
+_SEND_WORKERS = 4
+# Сколько запрос ждёт результата отправки (секунды)
+_SEND_TIMEOUT = 30.0
 
 
 class SendMessageRequest(BaseModel):
@@ -35,6 +108,26 @@ class SendMessageRequest(BaseModel):
     message: str
 
 
+if msgspec is not None:
+    class _SendMessageRequestStruct(msgspec.Struct):
+        """SendMessageRequest для разбора через msgspec."""
+        message: str
+        channel_id: Optional[int] = None
+
+    # strict=False: как и Pydantic, принимаем числа в строках ("channel_id": "123")
+    _send_request_decoder = msgspec.json.Decoder(_SendMessageRequestStruct, strict=False)
+
+
+# Тело /send разбирается вручную (_parse_send_request), поэтому схема
+# запроса передаётся в OpenAPI явно
+_SEND_REQUEST_OPENAPI: Dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": SendMessageRequest.model_json_schema()}},
+    }
+}
+
+
 class SendMessageResponse(BaseModel):
     """Модель ответа на отправку сообщения."""
     success: bool
@@ -57,41 +150,275 @@ class HealthResponse(BaseModel):
     telegram_authorized: bool
 
 
+def _setup_logging() -> None:
+    """
+    Настраивает логирование через очередь.
+    
+    Обработчики только кладут записи в очередь; форматирование и запись
+    в stdout выполняет фоновый поток QueueListener, не блокируя цикл событий.
+    Логи uvicorn идут туда же (uvicorn запускается с log_config=None).
+    Поток останавливается при выходе процесса, дописав очередь.
+    Повторные вызовы ничего не делают.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+    atexit.register(_stop_logging)
+    
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+
+def _stop_logging() -> None:
+    """Дописывает оставшиеся записи лога и останавливает фоновый поток."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle manager для FastAPI приложения."""
-    global _telegram_client
+    global _telegram_client, _config, _config_checked_at, _auth_cache
     
-    # Startup
-    print("Запуск вебхук-сервера...")
+    # Startup (логирование настраиваем и здесь — на случай запуска приложения через uvicorn напрямую)
+    _setup_logging()
+    logger.info("Запуск вебхук-сервера...")
+    _config = Config()
+    _config_checked_at = time.monotonic()
+    _refresh_selected_state(_config)
     _telegram_client = TelegramClientWrapper(_api_id, _api_hash)
     await _telegram_client.connect()
     
-    if not await _telegram_client.is_authorized():
-        print("ВНИМАНИЕ: Telegram не авторизован!")
-        print("Сначала запустите в интерактивном режиме для авторизации:")
-        print("  python main.py --interactive")
+    authorized = await _telegram_client.is_authorized()
+    _auth_cache = (time.monotonic(), authorized)
+    if not authorized:
+        logger.warning(
+            "Telegram не авторизован! Сначала запустите в интерактивном режиме "
+            "для авторизации: python main.py --interactive"
+        )
     else:
         me = await _telegram_client.get_me()
-        print(f"Telegram авторизован как: {me['first_name']} (@{me['username']})")
+        logger.info("Telegram авторизован как: %s (@%s)", me['first_name'], me['username'])
+    
+    _start_send_workers()
     
     yield
     
     # Shutdown
-    print("Остановка вебхук-сервера...")
+    logger.info("Остановка вебхук-сервера...")
+    await _stop_send_workers()
+    _auth_cache = (0.0, False)
     if _telegram_client:
         await _telegram_client.disconnect()
 
 
+# Документацию (/docs, /openapi.json) можно отключить: WEBHOOK_DOCS=0.
+# Тогда схема OpenAPI не строится вовсе.
+_DOCS_ENABLED = os.environ.get('WEBHOOK_DOCS', '1').lower() not in ('0', 'false', 'no')
+
 # Создаём приложение FastAPI
 app = FastAPI(
     title="Telegram Channel Manager",
     description="API для отправки сообщений в Telegram каналы",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=_JSONResponse,
+    openapi_url="/openapi.json" if _DOCS_ENABLED else None
 )
 
 
+def _get_config() -> Config:
+    """
+    Возвращает общий объект конфигурации.
+    
+    Не чаще раза в _CONFIG_CHECK_INTERVAL проверяет mtime config.json
+    и перечитывает файл, если его изменили (например, в интерактивном режиме).
+    """
+    global _config, _config_checked_at
+    if _config is None:
+        _config = Config()
+        _config_checked_at = time.monotonic()
+        _refresh_selected_state(_config)
+        return _config
+    now = time.monotonic()
+    if now - _config_checked_at >= _CONFIG_CHECK_INTERVAL:
+        _config_checked_at = now
+        if _config.reload_if_changed():
+            _refresh_selected_state(_config)
+    return _config
+
+
+def _refresh_selected_state(config: Config) -> None:
+    """Обновляет закэшированные порядок и множество выбранных каналов."""
+    global _selected_order, _selected_ids
+    _selected_order = tuple(config.get_selected_channels())
+    _selected_ids = frozenset(_selected_order)
+
+
+async def _is_authorized_cached() -> bool:
+    """
+    Проверяет авторизацию Telegram, переиспользуя результат _AUTH_CACHE_TTL секунд.
+    
+    Все эндпоинты работают в одном цикле событий, блокировка не нужна.
+    """
+    global _auth_cache
+    checked_at, authorized = _auth_cache
+    now = time.monotonic()
+    if checked_at and now - checked_at < _AUTH_CACHE_TTL:
+        return authorized
+    authorized = await _telegram_client.is_authorized()
+    _auth_cache = (time.monotonic(), authorized)
+    return authorized
+
+
+def _start_send_workers() -> None:
+    """Создаёт очередь отправки и запускает воркеры."""
+    global _send_queue, _send_worker_tasks
+    _send_queue = asyncio.Queue(maxsize=_SEND_QUEUE_SIZE)
+    _send_worker_tasks = [
+        asyncio.create_task(_send_worker(_send_queue)) for _ in range(_SEND_WORKERS)
+    ]
+
+
+async def _stop_send_workers() -> None:
+    """Останавливает воркеры; ожидающие в очереди запросы получают ошибку."""
+    global _send_queue, _send_worker_tasks
+    for task in _send_worker_tasks:
+        task.cancel()
+    await asyncio.gather(*_send_worker_tasks, return_exceptions=True)
+    _send_worker_tasks = []
+    if _send_queue is not None:
+        while not _send_queue.empty():
+            _, _, future = _send_queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Вебхук-сервер остановлен"))
+        _send_queue = None
+
+
+async def _send_worker(send_queue: asyncio.Queue) -> None:
+    """Выполняет задания из очереди отправки по одному."""
+    while True:
+        channel_id, text, future = await send_queue.get()
+        try:
+            # Запрос мог уже завершиться по таймауту — не отправляем впустую
+            if future.done():
+                continue
+            try:
+                result = await _telegram_client.send_message(channel_id, text)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            send_queue.task_done()
+
+
+async def _enqueue_send(channel_id: int, text: str) -> Optional[dict]:
+    """
+    Отправляет сообщение через очередь воркеров.
+    
+    Args:
+        channel_id: ID канала
+        text: Текст сообщения
+        
+    Returns:
+        Результат send_message или None при ошибке отправки
+        
+    Raises:
+        HTTPException: 503 — очередь переполнена, 504 — отправка не уложилась в _SEND_TIMEOUT
+    """
+    if _send_queue is None:
+        raise HTTPException(status_code=503, detail="Вебхук-сервер не запущен")
+    future = asyncio.get_running_loop().create_future()
+    try:
+        _send_queue.put_nowait((channel_id, text, future))
+    except asyncio.QueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Очередь отправки переполнена, повторите запрос позже"
+        )
+    try:
+        return await asyncio.wait_for(future, timeout=_SEND_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Превышено время ожидания отправки")
+
+
+def _default_channel_id() -> Optional[int]:
+    """Канал по умолчанию: webhook_default_channel или первый из выбранных."""
+    channel_id = _get_config().get_webhook_default_channel()
+    if channel_id is None and _selected_order:
+        channel_id = _selected_order[0]
+    return channel_id
+
+
+async def _parse_send_request(request: Request):
+    """
+    Разбирает и валидирует тело запроса на отправку.
+    
+    С msgspec JSON декодируется и проверяется за один проход без Pydantic.
+    Ошибки в обоих случаях возвращаются стандартным ответом 422 FastAPI.
+    
+    Args:
+        request: HTTP-запрос
+        
+    Returns:
+        Объект с полями message и channel_id
+    """
+    body = await request.body()
+    if msgspec is not None:
+        try:
+            return _send_request_decoder.decode(body)
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            raise RequestValidationError(
+                [{"loc": ("body",), "msg": str(e), "type": "value_error"}]
+            )
+    try:
+        return SendMessageRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+
+
+def _send_response(channel_id: int, result: Optional[dict]) -> Response:
+    """
+    Формирует ответ эндпоинтов отправки.
+    
+    Возвращается готовый Response: FastAPI не валидирует его повторно
+    через SendMessageResponse, модель остаётся только для документации.
+    Поля со значением None в ответ не включаются
+    (как при response_model_exclude_none=True).
+    
+    Args:
+        channel_id: ID канала
+        result: Результат send_message или None при ошибке
+        
+    Returns:
+        JSON-ответ в формате SendMessageResponse
+    """
+    if result:
+        content = {
+            "success": True,
+            "message_id": result['telegram_id'],
+            "channel_id": channel_id,
+        }
+    else:
+        content = {
+            "success": False,
+            "channel_id": channel_id,
+            "error": "Не удалось отправить сообщение",
+        }
+    return _JSONResponse(content)
+
+
 def _get_type_order_from_dialog_info(info: Optional[dict]) -> int:
     """
     Возвращает порядок типа диалога для сортировки.
@@ -122,62 +449,142 @@ def _get_type_order_from_dialog_info(info: Optional[dict]) -> int:
     return 99
 
 
+def _channel_name_key(ch: Dict[str, Any]) -> str:
+    return (ch['name'] or '').lower()
+
+
+def _sort_none(channels: List[Dict[str, Any]], selected_ids: FrozenSet[int],
+               type_orders: Dict[int, int]) -> List[Dict[str, Any]]:
+    return channels
+
+
+def _sort_selected(channels: List[Dict[str, Any]], selected_ids: FrozenSet[int],
+                   type_orders: Dict[int, int]) -> List[Dict[str, Any]]:
+    # sorted() стабилен: внутри групп сохраняется исходный порядок
+    return sorted(channels, key=lambda ch: ch['id'] not in selected_ids)
+
+
+def _sort_type_name(channels: List[Dict[str, Any]], selected_ids: FrozenSet[int],
+                    type_orders: Dict[int, int]) -> List[Dict[str, Any]]:
+    order = type_orders.get
+    return sorted(channels, key=lambda ch: (order(ch['id'], 99), (ch['name'] or '').lower()))
+
+
+def _sort_type_id(channels: List[Dict[str, Any]], selected_ids: FrozenSet[int],
+                  type_orders: Dict[int, int]) -> List[Dict[str, Any]]:
+    order = type_orders.get
+    return sorted(channels, key=lambda ch: (order(ch['id'], 99), ch['id']))
+
+
+def _sort_type_selected(channels: List[Dict[str, Any]], selected_ids: FrozenSet[int],
+                        type_orders: Dict[int, int]) -> List[Dict[str, Any]]:
+    order = type_orders.get
+    return sorted(
+        channels,
+        key=lambda ch: (
+            order(ch['id'], 99),
+            0 if ch['id'] in selected_ids else 1,
+            ch['id'],
+        ),
+    )
+
+
+def _sort_id(channels: List[Dict[str, Any]], selected_ids: FrozenSet[int],
+             type_orders: Dict[int, int]) -> List[Dict[str, Any]]:
+    return sorted(channels, key=itemgetter("id"))
+
+
+def _sort_name(channels: List[Dict[str, Any]], selected_ids: FrozenSet[int],
+               type_orders: Dict[int, int]) -> List[Dict[str, Any]]:
+    return sorted(channels, key=_channel_name_key)
+
+
+# Функция сортировки: (каналы, выбранные ID, channel_id -> type_order) -> каналы.
+# sorted(key=...) вычисляет ключ один раз на элемент и сравнивает кортежи в C,
+# поэтому отдельный decorate-sort-undecorate здесь ничего не даёт.
+_ChannelSorter = Callable[[List[Dict[str, Any]], FrozenSet[int], Dict[int, int]], List[Dict[str, Any]]]
+
+# Функции сортировки каналов по channels_sort_type
+_SORTERS: Dict[SortType, _ChannelSorter] = {
+    SortType.NONE: _sort_none,
+    SortType.SELECTED: _sort_selected,
+    SortType.TYPE: _sort_type_name,
+    SortType.TYPE_ID: _sort_type_id,
+    SortType.TYPE_NAME: _sort_type_name,
+    SortType.TYPE_SELECTED: _sort_type_selected,
+    SortType.ID: _sort_id,
+    SortType.NAME: _sort_name,
+}
+
+
 def _sort_channels_for_api(
-    channels: List[ChannelInfo],
+    channels: List[Dict[str, Any]],
     config: Config,
+    selected_ids: FrozenSet[int],
     type_orders: dict[int, int],
-) -> List[ChannelInfo]:
+) -> List[Dict[str, Any]]:
     """
     Применяет сортировку к списку каналов для API согласно настройкам.
     
     Args:
-        channels: Список ChannelInfo объектов
+        channels: Список каналов (словари с полями ChannelInfo)
         config: Объект конфигурации
+        selected_ids: Множество ID выбранных каналов
         type_orders: Словарь channel_id -> type_order (для сортировки по типу)
         
     Returns:
         Отсортированный список каналов
     """
-    sort_type = config.get_channels_sort_type()
-    selected_ids = set(config.get_selected_channels())
+    sorter = _SORTERS.get(config.get_channels_sort_type(), _sort_none)
+    return sorter(channels, selected_ids, type_orders)
 
-    def type_order(ch: ChannelInfo) -> int:
-        return type_orders.get(ch.id, 99)
-    
-    if sort_type == "none":
-        return channels
+
+async def _fetch_dialog_infos(channel_ids: List[int],
+                              refresh: bool = False) -> List[Optional[dict]]:
+    """
+    Получает информацию о диалогах: из кэша или параллельными запросами.
     
-    if sort_type == "selected":
-        selected_channels = [ch for ch in channels if ch.id in selected_ids]
-        other_channels = [ch for ch in channels if ch.id not in selected_ids]
-        return selected_channels + other_channels
+    В Telegram уходят только ID без свежей записи в кэше. Отсутствующие
+    диалоги (None) не кэшируются.
     
-    if sort_type == "type":
-        return sorted(channels, key=lambda ch: (type_order(ch), (ch.name or '').lower()))
+    Args:
+        channel_ids: Список ID каналов
+        refresh: Игнорировать кэш и запросить всё заново
+        
+    Returns:
+        Информация о каждом канале (None, если не найден) в порядке channel_ids
+    """
+    now = time.monotonic()
+    infos: Dict[int, Optional[dict]] = {}
+    missing: List[int] = []
+    for channel_id in channel_ids:
+        cached = None if refresh else _dialog_info_cache.get(channel_id)
+        if cached is not None and now - cached[0] < _DIALOG_INFO_TTL:
+            infos[channel_id] = cached[1]
+        else:
+            missing.append(channel_id)
 
-    if sort_type == "type_id":
-        return sorted(channels, key=lambda ch: (type_order(ch), ch.id))
+    if missing:
+        semaphore = asyncio.Semaphore(_DIALOG_INFO_CONCURRENCY)
 
-    if sort_type == "type_name":
-        return sorted(channels, key=lambda ch: (type_order(ch), (ch.name or '').lower()))
+        async def fetch(channel_id: int) -> Optional[dict]:
+            async with semaphore:
+                return await _telegram_client.get_dialog_info(channel_id)
 
-    if sort_type == "type_selected":
-        return sorted(
-            channels,
-            key=lambda ch: (
-                type_order(ch),
-                0 if ch.id in selected_ids else 1,
-                ch.id,
-            ),
-        )
-    
-    if sort_type == "id":
-        return sorted(channels, key=lambda ch: ch.id)
-    
-    if sort_type == "name":
-        return sorted(channels, key=lambda ch: (ch.name or '').lower())
-    
-    return channels
+        fetched = await asyncio.gather(*(fetch(channel_id) for channel_id in missing))
+        now = time.monotonic()
+        for channel_id, info in zip(missing, fetched):
+            infos[channel_id] = info
+            if info is None:
+                _dialog_info_cache.pop(channel_id, None)
+                continue
+            # Перевставка переносит ключ в конец: первым вытесняется самый старый
+            _dialog_info_cache.pop(channel_id, None)
+            _dialog_info_cache[channel_id] = (now, info)
+        while len(_dialog_info_cache) > _DIALOG_INFO_CACHE_SIZE:
+            del _dialog_info_cache[next(iter(_dialog_info_cache))]
+
+    return [infos[channel_id] for channel_id in channel_ids]
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -188,122 +595,104 @@ async def health_check():
     
     if connected:
         try:
-            authorized = await _telegram_client.is_authorized()
+            authorized = await _is_authorized_cached()
         except Exception:
             pass
     
-    return HealthResponse(
-        status="ok" if connected and authorized else "degraded",
-        telegram_connected=connected,
-        telegram_authorized=authorized
-    )
+    return _JSONResponse({
+        "status": "ok" if connected and authorized else "degraded",
+        "telegram_connected": connected,
+        "telegram_authorized": authorized,
+    })
 
 
 @app.get("/channels", response_model=list[ChannelInfo])
-async def get_channels():
-    """Возвращает список выбранных каналов."""
-    config = Config()
-    channel_ids = config.get_selected_channels()
+async def get_channels(refresh: bool = False):
+    """
+    Возвращает список выбранных каналов.
+    
+    Информация о каналах кэшируется; ?refresh=1 запрашивает её заново.
+    """
+    config = _get_config()
+    channel_ids = _selected_order
     
     channels = []
     type_orders: dict[int, int] = {}
-    for channel_id in channel_ids:
-        info = await _telegram_client.get_dialog_info(channel_id)
+    infos = await _fetch_dialog_infos(channel_ids, refresh=refresh)
+    for channel_id, info in zip(channel_ids, infos):
         if info:
             type_orders[channel_id] = _get_type_order_from_dialog_info(info)
-            channels.append(ChannelInfo(
-                id=channel_id,
-                name=info.get('title', info.get('first_name')),
-                username=info.get('username')
-            ))
+            channels.append({
+                "id": channel_id,
+                "name": info.get('title', info.get('first_name')),
+                "username": info.get('username'),
+            })
         else:
             type_orders[channel_id] = 99
-            channels.append(ChannelInfo(id=channel_id))
+            channels.append({"id": channel_id, "name": None, "username": None})
     
     # Применяем сортировку
-    channels = _sort_channels_for_api(channels, config, type_orders)
+    channels = _sort_channels_for_api(channels, config, _selected_ids, type_orders)
     
-    return channels
+    # Список словарей сериализуется напрямую, без построения ChannelInfo;
+    # response_model остаётся для документации
+    return _JSONResponse(channels)
 
 
-@app.post("/send", response_model=SendMessageResponse)
-async def send_message(request: SendMessageRequest):
+@app.post("/send", response_model=SendMessageResponse, response_model_exclude_none=True,
+          openapi_extra=_SEND_REQUEST_OPENAPI)
+async def send_message(http_request: Request):
     """
     Отправляет сообщение в канал.
     
     channel_id может быть указан в теле запроса или взят из конфигурации.
     """
+    request = await _parse_send_request(http_request)
+    
     # Проверяем авторизацию
-    if not await _telegram_client.is_authorized():
+    if not await _is_authorized_cached():
         raise HTTPException(
             status_code=503,
             detail="Telegram не авторизован. Запустите в интерактивном режиме."
         )
     
-    # Определяем канал
+    # Определяем канал: конфигурация нужна, только если его нет в запросе
     channel_id = request.channel_id
     if channel_id is None:
-        config = Config()
-        channel_id = config.get_webhook_default_channel()
-        
+        channel_id = _default_channel_id()
         if channel_id is None:
-            # Берём первый из выбранных
-            selected = config.get_selected_channels()
-            if selected:
-                channel_id = selected[0]
-    
-    if channel_id is None:
-        raise HTTPException(
-            status_code=400,
-            detail="channel_id не указан и нет канала по умолчанию"
-        )
+            raise HTTPException(
+                status_code=400,
+                detail="channel_id не указан и нет канала по умолчанию"
+            )
     
     # Отправляем сообщение
-    result = await _telegram_client.send_message(channel_id, request.message)
+    result = await _enqueue_send(channel_id, request.message)
     
-    if result:
-        return SendMessageResponse(
-            success=True,
-            message_id=result['telegram_id'],
-            channel_id=channel_id
-        )
-    else:
-        return SendMessageResponse(
-            success=False,
-            channel_id=channel_id,
-            error="Не удалось отправить сообщение"
-        )
+    return _send_response(channel_id, result)
 
 
-@app.post("/send/{channel_id}", response_model=SendMessageResponse)
-async def send_message_to_channel(channel_id: int, request: SendMessageRequest):
+@app.post("/send/{channel_id}", response_model=SendMessageResponse,
+          response_model_exclude_none=True, openapi_extra=_SEND_REQUEST_OPENAPI)
+async def send_message_to_channel(channel_id: int, http_request: Request):
     """
     Отправляет сообщение в указанный канал.
     
-    channel_id берётся из URL.
+    channel_id берётся из URL (channel_id в теле игнорируется).
     """
+    request = await _parse_send_request(http_request)
+    
     # Проверяем авторизацию
-    if not await _telegram_client.is_authorized():
+    if not await _is_authorized_cached():
         raise HTTPException(
             status_code=503,
             detail="Telegram не авторизован. Запустите в интерактивном режиме."
         )
     
     # Отправляем сообщение
-    result = await _telegram_client.send_message(channel_id, request.message)
+    result = await _enqueue_send(channel_id, request.message)
     
-    if result:
-        return SendMessageResponse(
-            success=True,
-            message_id=result['telegram_id'],
-            channel_id=channel_id
-        )
-    else:
-        return SendMessageResponse(
-            success=False,
-            channel_id=channel_id,
-            error="Не удалось отправить сообщение"
-        )
+    return _send_response(channel_id, result)
 
 
 def run_webhook_server(api_id: int, api_hash: str, port: int = 8080):
@@ -319,14 +708,19 @@ def run_webhook_server(api_id: int, api_hash: str, port: int = 8080):
     _api_id = api_id
     _api_hash = api_hash
     
-    print(f"\n=== Telegram Channel Manager - Webhook Server ===")
-    print(f"Порт: {port}")
-    print(f"Документация: http://localhost:{port}/docs")
-    print()
+    _setup_logging()
+    logger.info("=== Telegram Channel Manager - Webhook Server ===")
+    logger.info("Порт: %s", port)
+    if _DOCS_ENABLED:
+        logger.info("Документация: http://localhost:%s/docs", port)
+    logger.info("Event loop: %s, HTTP: %s", _UVICORN_LOOP, _UVICORN_HTTP)
     
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=port,
-        log_level="info"
+        loop=_UVICORN_LOOP,
+        http=_UVICORN_HTTP,
+        log_level="info",
+        log_config=None
     )
@@ -13,6 +13,10 @@ from typing import List, Dict, Any, Optional
 from .message_chains import separate_standalone_and_chains, get_chain_statistics
 from .timezone import get_timezone
 
+# Разделители текстового вывода
+_SEP40 = "-" * 40
+_SEP60 = "=" * 60
+
 
 def _utc_to_display_dt(naive_utc: datetime) -> datetime:
     """Переводит наивный UTC datetime в зону отображения (TIMEZONE)."""
@@ -53,20 +57,15 @@ def format_messages(messages: List[Dict[str, Any]],
         
         # Выводим одиночные сообщения
         if standalone:
-            lines.append("=" * 60)
-            lines.append("ОДИНОЧНЫЕ СООБЩЕНИЯ")
-            lines.append("=" * 60)
+            lines.extend((_SEP60, "ОДИНОЧНЫЕ СООБЩЕНИЯ", _SEP60))
             
             for msg in standalone:
                 lines.append(_format_single_message(msg))
-                lines.append("-" * 40)
+                lines.append(_SEP40)
         
         # Выводим цепочки
         if chains:
-            lines.append("")
-            lines.append("=" * 60)
-            lines.append(f"ЦЕПОЧКИ СООБЩЕНИЙ ({len(chains)})")
-            lines.append("=" * 60)
+            lines.extend(("", _SEP60, f"ЦЕПОЧКИ СООБЩЕНИЙ ({len(chains)})", _SEP60))
             
             for i, chain in enumerate(chains, 1):
                 lines.append(f"\n--- Цепочка #{i} ({len(chain)} сообщений) ---")
@@ -75,26 +74,35 @@ def format_messages(messages: List[Dict[str, Any]],
                     prefix = "ROOT" if j == 0 else f"  └─ RE"
                     lines.append(f"{prefix}: {_format_single_message(msg, compact=True)}")
                 
-                lines.append("-" * 40)
+                lines.append(_SEP40)
         
         # Статистика
         stats = get_chain_statistics(chains)
-        lines.append("")
-        lines.append(f"Всего: {len(messages)} сообщений")
-        lines.append(f"  - Одиночных: {len(standalone)}")
-        lines.append(f"  - В цепочках: {stats['total_messages']} ({stats['total_chains']} цепочек)")
+        lines.extend((
+            "",
+            f"Всего: {len(messages)} сообщений",
+            f"  - Одиночных: {len(standalone)}",
+            f"  - В цепочках: {stats['total_messages']} ({stats['total_chains']} цепочек)",
+        ))
     
     else:
         # Простой вывод без группировки
         for msg in messages:
             lines.append(_format_single_message(msg))
-            lines.append("-" * 40)
+            lines.append(_SEP40)
         
         lines.append(f"\nВсего: {len(messages)} сообщений")
     
     return "\n".join(lines)
 
 
+def _as_str(value: Any) -> str:
+    """Приводит поле отправителя к строке (None -> пустая строка)."""
+    if isinstance(value, str):
+        return value
+    return str(value) if value is not None else ""
+
+
 def _format_single_message(msg: Dict[str, Any], compact: bool = False) -> str:
     """Форматирует одно сообщение."""
 
@@ -112,24 +120,14 @@ def _format_single_message(msg: Dict[str, Any], compact: bool = False) -> str:
     sender = msg.get('sender')
     if sender:
         # Нормализуем поля: Telegram иногда отдаёт None вместо строк.
-        first_name = sender.get("first_name")
-        last_name = sender.get("last_name")
-        username = sender.get("username")
-
-        first_name = first_name if isinstance(first_name, str) else (str(first_name) if first_name is not None else "")
-        last_name = last_name if isinstance(last_name, str) else (str(last_name) if last_name is not None else "")
-        username = username if isinstance(username, str) else (str(username) if username is not None else "")
-
-        sender_name = (first_name + (f" {last_name}" if last_name else "")).strip()
+        first_name = _as_str(sender.get("first_name"))
+        last_name = _as_str(sender.get("last_name"))
+        username = _as_str(sender.get("username"))
 
+        sender_name = f"{first_name} {last_name}".strip() if last_name else first_name.strip()
         if username:
-            if sender_name:
-                sender_name += f" (@{username})"
-            else:
-                sender_name = f"@{username}"
-
-        if not sender_name:
-            sender_name = "Неизвестно"
+            sender_name = f"{sender_name} (@{username})" if sender_name else f"@{username}"
+        sender_name = sender_name or "Неизвестно"
     else:
         sender_name = "Неизвестно"
     
@@ -175,11 +173,13 @@ def format_message_json(msg: Dict[str, Any]) -> Dict[str, Any]:
     # Обрабатываем дату (входящая — наивный UTC, выводим в зоне из TIMEZONE)
     date = msg.get('date')
     if isinstance(date, datetime):
-        display_dt = _utc_to_display_dt(date)
-        date_str = display_dt.replace(tzinfo=None).isoformat() if display_dt.tzinfo else display_dt.isoformat()
+        # _utc_to_display_dt всегда возвращает datetime с зоной — выводим локальное время без неё
+        date_str = _utc_to_display_dt(date).replace(tzinfo=None).isoformat()
     else:
         date_str = str(date) if date else None
     
+    # Словарь собирается одним литералом, включая отправителя
+    sender = msg.get('sender')
     result = {
         'id': msg.get('telegram_id'),
         'channel_id': msg.get('channel_id'),
@@ -187,19 +187,13 @@ def format_message_json(msg: Dict[str, Any]) -> Dict[str, Any]:
         'content': msg.get('content'),
         'reactions_count': msg.get('reactions_count', 0),
         'reply_to_msg_id': msg.get('reply_to_msg_id'),
-    }
-    
-    # Добавляем информацию об отправителе
-    sender = msg.get('sender')
-    if sender:
-        result['sender'] = {
+        'sender': {
             'id': sender.get('id'),
             'first_name': sender.get('first_name'),
             'last_name': sender.get('last_name'),
             'username': sender.get('username')
-        }
-    else:
-        result['sender'] = None
+        } if sender else None,
+    }
     
     # Дополнительные поля если есть
     if 'views' in msg:
@@ -246,7 +240,7 @@ def format_channels_list(channels: List[Dict[str, Any]]) -> str:
     if not channels:
         return "Нет каналов"
     
-    lines = ["=" * 60, "СПИСОК КАНАЛОВ", "=" * 60, ""]
+    lines = [_SEP60, "СПИСОК КАНАЛОВ", _SEP60, ""]
     
     for i, ch in enumerate(channels, 1):
         lines.append(f"{i}. {ch.get('name', 'Без названия')}")
@@ -271,9 +265,9 @@ def format_statistics(stats: Dict[str, Any]) -> str:
         Отформатированная строка
     """
     lines = [
-        "=" * 60,
+        _SEP60,
         "СТАТИСТИКА",
-        "=" * 60,
+        _SEP60,
         "",
         f"Всего сообщений: {stats.get('total_messages', 0)}",
         f"Всего отправителей: {stats.get('total_senders', 0)}",
@@ -5,11 +5,62 @@
 Первое сообщение в цепочке (корень) не имеет reply_to_msg_id.
 """
 
-from typing import List, Dict, Any, Tuple, Set
-from collections import defaultdict
+from typing import List, Dict, Any, Optional, Tuple, Set
+from collections import defaultdict, deque
 
 
-def find_chain_roots(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# Индекс сообщений: (telegram_id -> сообщение, parent_id -> ответы из списка)
+_MessageIndex = Tuple[
+    Dict[int, Dict[str, Any]],
+    Dict[int, List[Dict[str, Any]]],
+]
+
+
+def _date_key(msg: Dict[str, Any]) -> Any:
+    """Ключ сортировки по дате; сообщения без даты считаются самыми ранними."""
+    return msg.get('date') or ''
+
+
+def _reply_key(msg: Dict[str, Any]) -> Any:
+    """
+    Ключ сортировки ответов цепочки: по дате, при равной дате - по telegram_id.
+    
+    Даты Telegram с точностью до секунды, поэтому в активных чатах совпадают;
+    без второго ключа порядок таких ответов зависел бы от порядка получения.
+    """
+    return msg.get('date') or '', msg['telegram_id']
+
+
+def _index_messages(messages: List[Dict[str, Any]]) -> _MessageIndex:
+    """
+    Строит индексы сообщений за один проход.
+    
+    Args:
+        messages: Список сообщений
+        
+    Returns:
+        Кортеж (msg_by_id, children_map). children_map содержит только
+        родителей из списка.
+    """
+    msg_by_id: Dict[int, Dict[str, Any]] = {}
+    replies_by_parent: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for msg in messages:
+        msg_by_id[msg['telegram_id']] = msg
+        reply_to = msg.get('reply_to_msg_id')
+        if reply_to:
+            replies_by_parent[reply_to].append(msg)
+    
+    # Родитель может идти в списке позже ответа, поэтому фильтруем после прохода
+    children_map = {
+        parent_id: children
+        for parent_id, children in replies_by_parent.items()
+        if parent_id in msg_by_id
+    }
+    return msg_by_id, children_map
+
+
+def find_chain_roots(messages: List[Dict[str, Any]],
+                     _index: Optional[_MessageIndex] = None) -> List[Dict[str, Any]]:
     """
     Находит корневые сообщения цепочек.
     
@@ -18,40 +69,30 @@ def find_chain_roots(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     
     Args:
         messages: Список сообщений
+        _index: Готовый индекс из _index_messages (для внутренних вызовов)
         
     Returns:
         Список корневых сообщений
     """
-    # Собираем ID всех сообщений
-    message_ids = {msg['telegram_id'] for msg in messages}
-    
-    # Собираем ID сообщений, на которые есть ответы
-    replied_to_ids: Set[int] = set()
-    for msg in messages:
-        if msg.get('reply_to_msg_id'):
-            replied_to_ids.add(msg['reply_to_msg_id'])
+    msg_by_id, children_map = _index if _index is not None else _index_messages(messages)
     
     # Корни - сообщения, на которые есть ответы, но сами они не ответы
     # (или их родитель не в списке)
-    roots = []
-    for msg in messages:
-        msg_id = msg['telegram_id']
-        reply_to = msg.get('reply_to_msg_id')
-        
-        # Это корень если:
-        # 1. На него есть ответы
-        # 2. Оно не является ответом ИЛИ его родитель не в списке
-        if msg_id in replied_to_ids:
-            if not reply_to or reply_to not in message_ids:
-                roots.append(msg)
+    roots = [
+        msg for msg in messages
+        if msg['telegram_id'] in children_map
+        and (not msg.get('reply_to_msg_id')
+             or msg['reply_to_msg_id'] not in msg_by_id)
+    ]
     
     # Сортируем по дате
-    roots.sort(key=lambda x: x.get('date') or '', reverse=True)
+    roots.sort(key=_date_key, reverse=True)
     
     return roots
 
 
-def build_chains(messages: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+def build_chains(messages: List[Dict[str, Any]],
+                 _index: Optional[_MessageIndex] = None) -> List[List[Dict[str, Any]]]:
     """
     Группирует сообщения в цепочки.
     
@@ -60,6 +101,7 @@ def build_chains(messages: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
     
     Args:
         messages: Список сообщений
+        _index: Готовый индекс из _index_messages (для внутренних вызовов)
         
     Returns:
         Список цепочек (каждая цепочка - список сообщений)
@@ -67,68 +109,58 @@ def build_chains(messages: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
     if not messages:
         return []
     
-    # Создаём индекс сообщений по telegram_id
-    msg_by_id: Dict[int, Dict[str, Any]] = {}
-    for msg in messages:
-        msg_by_id[msg['telegram_id']] = msg
-    
-    # Строим граф ответов: parent_id -> [children]
-    children_map: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
-    for msg in messages:
-        reply_to = msg.get('reply_to_msg_id')
-        if reply_to and reply_to in msg_by_id:
-            children_map[reply_to].append(msg)
+    index = _index if _index is not None else _index_messages(messages)
     
-    # Сортируем детей по дате
-    for children in children_map.values():
-        children.sort(key=lambda x: x.get('date') or '')
+    # Граф ответов parent_id -> [children]; порядок детей не важен:
+    # ответы цепочки сортируются один раз после обхода
+    _, children_map = index
+    if not children_map:
+        # Ни одного ответа на сообщение из списка - цепочек нет
+        return []
     
     # Находим корни
-    roots = find_chain_roots(messages)
+    roots = find_chain_roots(messages, index)
     
-    # Строим цепочки рекурсивно
+    # Строим цепочки обходом в ширину от каждого корня; очередь общая для всех корней
     chains = []
     visited: Set[int] = set()
+    queue: deque = deque()
     
-    def build_chain(root: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Строит цепочку начиная с корня."""
-        chain = [root]
-        visited.add(root['telegram_id'])
+    for root in roots:
+        root_id = root['telegram_id']
+        if root_id in visited:
+            continue
         
-        # Добавляем всех потомков рекурсивно (BFS)
-        queue = [root['telegram_id']]
+        chain = [root]
+        visited.add(root_id)
+        queue.append(root_id)
         while queue:
-            current_id = queue.pop(0)
-            for child in children_map.get(current_id, []):
-                if child['telegram_id'] not in visited:
+            for child in children_map.get(queue.popleft(), ()):
+                child_id = child['telegram_id']
+                if child_id not in visited:
+                    visited.add(child_id)
                     chain.append(child)
-                    visited.add(child['telegram_id'])
-                    queue.append(child['telegram_id'])
+                    queue.append(child_id)
         
         # Сортируем по дате (кроме корня)
         if len(chain) > 1:
-            root_msg = chain[0]
-            replies = sorted(chain[1:], key=lambda x: x.get('date') or '')
-            chain = [root_msg] + replies
+            chain[1:] = sorted(chain[1:], key=_reply_key)
         
-        return chain
-    
-    for root in roots:
-        if root['telegram_id'] not in visited:
-            chain = build_chain(root)
-            chains.append(chain)
+        chains.append(chain)
     
     return chains
 
 
 def separate_standalone_and_chains(
-    messages: List[Dict[str, Any]]
+    messages: List[Dict[str, Any]],
+    _index: Optional[_MessageIndex] = None,
 ) -> Tuple[List[Dict[str, Any]], List[List[Dict[str, Any]]]]:
     """
     Разделяет сообщения на одиночные и цепочки.
     
     Args:
         messages: Список сообщений
+        _index: Готовый индекс из _index_messages (для внутренних вызовов)
         
     Returns:
         Кортеж (одиночные_сообщения, цепочки)
@@ -136,18 +168,16 @@ def separate_standalone_and_chains(
     if not messages:
         return [], []
     
-    # Собираем ID всех сообщений
-    message_ids = {msg['telegram_id'] for msg in messages}
-    
-    # Определяем, какие сообщения являются частью цепочек
-    in_chain: Set[int] = set()
+    index = _index if _index is not None else _index_messages(messages)
+    _, children_map = index
+    if not children_map:
+        # Ни одного ответа на сообщение из списка - все сообщения одиночные
+        return sorted(messages, key=_date_key, reverse=True), []
     
-    # Сообщения, на которые есть ответы
-    for msg in messages:
-        reply_to = msg.get('reply_to_msg_id')
-        if reply_to and reply_to in message_ids:
-            in_chain.add(reply_to)
-            in_chain.add(msg['telegram_id'])
+    # Часть цепочек - сообщения из списка, на которые есть ответы, и сами эти ответы
+    in_chain: Set[int] = set(children_map)
+    for children in children_map.values():
+        in_chain.update(child['telegram_id'] for child in children)
     
     # Разделяем
     standalone = []
@@ -159,11 +189,12 @@ def separate_standalone_and_chains(
         else:
             standalone.append(msg)
     
-    # Строим цепочки из chain_messages
-    chains = build_chains(chain_messages)
+    # Индекс всего списка подходит и для chain_messages: все ответы и их
+    # родители из списка попали в chain_messages
+    chains = build_chains(chain_messages, index)
     
     # Сортируем одиночные по дате
-    standalone.sort(key=lambda x: x.get('date') or '', reverse=True)
+    standalone.sort(key=_date_key, reverse=True)
     
     return standalone, chains
 
@@ -184,13 +215,32 @@ def get_chain_depth(chain: List[Dict[str, Any]]) -> int:
     # Создаём индекс
     msg_by_id = {msg['telegram_id']: msg for msg in chain}
     
-    def get_depth(msg: Dict[str, Any], depth: int = 1) -> int:
-        reply_to = msg.get('reply_to_msg_id')
-        if reply_to and reply_to in msg_by_id:
-            return get_depth(msg_by_id[reply_to], depth + 1)
-        return depth
-    
-    return max(get_depth(msg) for msg in chain)
+    # Глубина каждого сообщения: 1 для корня, иначе глубина родителя + 1.
+    # Считаем итеративно с запоминанием, чтобы не проходить путь к корню заново
+    # для каждого сообщения и не упираться в лимит рекурсии.
+    depth_cache: Dict[int, int] = {}
+    for msg in chain:
+        path: List[int] = []
+        on_path: Set[int] = set()
+        current = msg
+        while True:
+            msg_id = current['telegram_id']
+            if msg_id in depth_cache:
+                base = depth_cache[msg_id]
+                break
+            path.append(msg_id)
+            on_path.add(msg_id)
+            reply_to = current.get('reply_to_msg_id')
+            # on_path защищает от зацикленных ответов
+            if reply_to and reply_to in msg_by_id and reply_to not in on_path:
+                current = msg_by_id[reply_to]
+            else:
+                base = 0
+                break
+        for offset, msg_id in enumerate(reversed(path), 1):
+            depth_cache[msg_id] = base + offset
+    
+    return max(depth_cache.values())
 
 
 def get_chain_statistics(chains: List[List[Dict[str, Any]]]) -> Dict[str, Any]:
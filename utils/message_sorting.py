@@ -8,6 +8,20 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, List, Tuple
 
+_VALID_ORDERS = frozenset(("telegram", "id_asc", "id_desc"))
+
+
+def _id_key(m: Dict[str, Any]) -> int:
+    """Ключ сортировки по telegram_id (int, при ошибке -1)."""
+    mid = m.get("telegram_id")
+    if type(mid) is int:
+        return mid
+    try:
+        return int(mid)
+    except Exception:
+        # Не ожидается, но чтобы сортировка была тотальной.
+        return -1
+
 
 def group_and_sort_messages(
     messages: Iterable[Dict[str, Any]],
@@ -27,8 +41,8 @@ def group_and_sort_messages(
     Returns:
         Список пар (channel_id, messages_for_channel)
     """
-    groups: List[Tuple[int, List[Dict[str, Any]]]] = []
-    index_by_channel: Dict[int, int] = {}
+    # dict сохраняет порядок вставки — это и есть порядок первого появления канала.
+    groups_by_channel: Dict[int, List[Dict[str, Any]]] = {}
 
     for msg in messages:
         channel_id = msg.get("channel_id")
@@ -37,36 +51,31 @@ def group_and_sort_messages(
             continue
 
         # channel_id в проекте ожидается int, но не ломаемся на строках.
-        try:
-            channel_key = int(channel_id)
-        except Exception:
-            continue
-
-        idx = index_by_channel.get(channel_key)
-        if idx is None:
-            index_by_channel[channel_key] = len(groups)
-            groups.append((channel_key, [msg]))
+        if type(channel_id) is int:
+            channel_key = channel_id
         else:
-            groups[idx][1].append(msg)
+            try:
+                channel_key = int(channel_id)
+            except Exception:
+                continue
+
+        bucket = groups_by_channel.get(channel_key)
+        if bucket is None:
+            groups_by_channel[channel_key] = [msg]
+        else:
+            bucket.append(msg)
+
+    groups = list(groups_by_channel.items())
 
-    if sort_order not in ("telegram", "id_asc", "id_desc"):
+    if sort_order not in _VALID_ORDERS:
         sort_order = "telegram"
 
     if sort_order == "telegram":
         return groups
 
     reverse = sort_order == "id_desc"
-
-    def id_key(m: Dict[str, Any]) -> int:
-        mid = m.get("telegram_id")
-        try:
-            return int(mid)
-        except Exception:
-            # Не ожидается, но чтобы сортировка была тотальной.
-            return -1
-
     for _, msgs in groups:
-        msgs.sort(key=id_key, reverse=reverse)
+        msgs.sort(key=_id_key, reverse=reverse)
 
     return groups
 
@@ -7,24 +7,56 @@
 
 import os
 import warnings
+from functools import lru_cache
+from typing import Optional
 from zoneinfo import ZoneInfo
 
+# Зона, вычисленная при первом вызове get_timezone (TIMEZONE после старта не меняется)
+_CACHED_TZ: Optional[ZoneInfo] = None
 
-def get_timezone() -> ZoneInfo:
+
+@lru_cache(maxsize=4)
+def _make_tz(name: str) -> ZoneInfo:
     """
-    Возвращает объект временной зоны из переменной окружения TIMEZONE.
+    Создаёт ZoneInfo по имени зоны (с кэшем: дата форматируется для каждого сообщения).
+
+    Args:
+        name: Имя временной зоны
 
     Returns:
-        ZoneInfo для указанной зоны (например Europe/Moscow, UTC).
-        При пустом или невалидном значении возвращается UTC.
+        ZoneInfo для указанной зоны или UTC, если имя невалидно.
     """
-    name = (os.environ.get("TIMEZONE") or "").strip() or "UTC"
     try:
         return ZoneInfo(name)
     except Exception:
         warnings.warn(
             f"Неверное значение TIMEZONE='{name}', используется UTC.",
             UserWarning,
-            stacklevel=2,
+            stacklevel=3,
         )
         return ZoneInfo("UTC")
+
+
+def get_timezone() -> ZoneInfo:
+    """
+    Возвращает объект временной зоны из переменной окружения TIMEZONE.
+
+    Переменная читается один раз; чтобы применить новое значение,
+    вызовите reset_timezone_cache().
+
+    Returns:
+        ZoneInfo для указанной зоны (например Europe/Moscow, UTC).
+        При пустом или невалидном значении возвращается UTC.
+    """
+    global _CACHED_TZ
+    if _CACHED_TZ is None:
+        name = (os.environ.get("TIMEZONE") or "").strip() or "UTC"
+        _CACHED_TZ = _make_tz(name)
+    return _CACHED_TZ
+
+
+def reset_timezone_cache() -> None:
+    """Сбрасывает закэшированную зону, чтобы перечитать TIMEZONE (например, после изменения окружения)."""
+    global _CACHED_TZ
+    _CACHED_TZ = None
+    _make_tz.cache_clear()